@@ -1,27 +1,159 @@
+from __future__ import annotations
+
 import os
+import heapq
+from itertools import repeat
+from typing import Iterable, Iterator, NamedTuple
+
+from src.utils.io import (
+    read_multi_input, iter_multi_input, read_int_groups, iter_lines, find_shards, iter_range_lines
+)
+from src.utils.lazy import lazy_import
 
-from src.utils.io import read_multi_input
+np = lazy_import('numpy')
 
 MODULE = os.path.split(os.path.split(__file__)[0])[1]
 
 
-def get_top_n_max_calories(calories: list[list[int]], n: int = 1) -> int:
-    calories_per_elf = (sum(elf_calories) for elf_calories in calories)
+class BulkCalories(NamedTuple):
+    # Flat calories plus the offset where each elf starts
+    values: np.ndarray[np.int64]
+    offsets: np.ndarray[np.intp]
+
+
+class TopCalories:
+
+    def __init__(self, n: int = 1):
+        if n < 0:
+            raise ValueError(f'Cannot keep the top {n} elves')
+        self._n = n
+        # Min heap, so the smallest of the best is always the one to replace
+        self._heap = []
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    @property
+    def values(self) -> list[int]:
+        return sorted(self._heap, reverse=True)
+
+    @property
+    def total(self) -> int:
+        # The top zero elves carry nothing, seen or not
+        if not self._heap and self._n:
+            raise ValueError('No elves seen yet')
+        return sum(self._heap)
+
+    def add(self, calories: int):
+        if len(self._heap) < self._n:
+            heapq.heappush(self._heap, calories)
+        elif self._heap and calories > self._heap[0]:
+            heapq.heapreplace(self._heap, calories)
+
+    def update(self, calories_per_elf: Iterable[int]):
+        for calories in calories_per_elf:
+            self.add(calories)
+
+    def merge(self, other: "TopCalories"):
+        self.update(other._heap)
+
+
+def iter_calories_per_elf(lines: Iterable[str], end: str = '') -> Iterator[int]:
+    # None until the current elf has at least one item
+    total = None
+    for line in lines:
+        if line != end:
+            total = (total or 0) + int(line)
+        elif total is not None:
+            yield total
+            total = None
+
+    if total is not None:
+        yield total
+
+
+def get_top_n_max_calories(calories: Iterable[list[int]] | BulkCalories, n: int = 1) -> int:
+    # A plain tuple of elves is not bulk data
+    if isinstance(calories, BulkCalories):
+        return get_top_n_max_calories_bulk(*calories, n=n)
+
+    top = TopCalories(n)
+    top.update(sum(elf_calories) for elf_calories in calories)
+    return top.total
+
+
+def get_top_n_max_calories_bulk(
+        calories: np.ndarray[np.int64],
+        offsets: np.ndarray[np.intp],
+        n: int = 1
+) -> int:
+    if n < 0:
+        raise ValueError(f'Cannot keep the top {n} elves')
+    if n == 0:
+        return 0
+    calories_per_elf = np.add.reduceat(calories, offsets)
     if n == 1:
-        return max(calories_per_elf)
-    return sum(sorted(calories_per_elf, reverse=True)[:n])
+        return int(np.max(calories_per_elf))
+    if n >= len(calories_per_elf):
+        return int(np.sum(calories_per_elf))
+    return int(np.sum(np.partition(calories_per_elf, -n)[-n:]))
+
+
+def get_shard_top_calories(path: str, start: int, end: int, n: int) -> TopCalories:
+    top = TopCalories(n)
+    top.update(iter_calories_per_elf(iter_range_lines(path, start, end)))
+    return top
+
+
+def get_top_n_max_calories_sharded(
+        filename: str,
+        n: int = 1,
+        shards: int = None,
+        jobs: int = None
+) -> int:
+    path = os.path.join('src', MODULE, 'input', filename)
+    # Shards end right after a blank line, so no elf is split between two of them
+    ranges = find_shards(path, shards or os.cpu_count() or 1)
+    starts, ends = zip(*ranges) if ranges else ((), ())
+
+    top = TopCalories(n)
+    if jobs == 1:
+        for partial in map(get_shard_top_calories, repeat(path), starts, ends, repeat(n)):
+            top.merge(partial)
+        return top.total
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(jobs) as executor:
+        for partial in executor.map(get_shard_top_calories, repeat(path), starts, ends, repeat(n)):
+            top.merge(partial)
+    return top.total
+
+
+def read_calories_per_elf(filename: str) -> Iterator[int]:
+    path = os.path.join('src', MODULE, 'input', filename)
+    return iter_calories_per_elf(iter_lines(path))
 
 
-def read(filename: str) -> list[list[int]]:
+def read(
+        filename: str,
+        lazy: bool = False,
+        bulk: bool = False
+) -> Iterable[list[int]] | BulkCalories:
     path = os.path.join('src', MODULE, 'input', filename)
+    if bulk:
+        return BulkCalories(*read_int_groups(path))
+    if lazy:
+        return iter_multi_input(path, transform=int)
     return read_multi_input(path, transform=int)
 
 
-def solve_part_one(calories: list[list[int]]) -> int:
+def solve_part_one(calories: Iterable[list[int]] | BulkCalories) -> int:
     return get_top_n_max_calories(calories)
 
 
-def solve_part_two(calories: list[list[int]]) -> int:
+def solve_part_two(calories: Iterable[list[int]] | BulkCalories) -> int:
     return get_top_n_max_calories(calories, n=3)
 
 
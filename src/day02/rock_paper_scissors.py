@@ -1,7 +1,13 @@
+from __future__ import annotations
+
 import os
 from enum import Enum
+from typing import Iterable
+
+from src.utils.io import read_input, iter_input, MappedFile
+from src.utils.lazy import lazy_import
 
-from src.utils.io import read_input
+np = lazy_import('numpy')
 
 MODULE = os.path.split(os.path.split(__file__)[0])[1]
 
@@ -59,41 +65,172 @@ def reverse_outcome():
     return {(rival, outcome): mine for (mine, rival), outcome in GAME_OUTCOME.items()}
 
 
-def simulate(strategy: list[tuple[str, str]]) -> int:
-    strategy = [
-        (Action.from_char(rival), Action.from_char(mine))
-        for rival, mine in strategy
-    ]
-    return sum(mine.value + GAME_OUTCOME[mine, rival].value for rival, mine in strategy)
+EXPECTED_SHAPE = reverse_outcome()
 
+RIVAL_CHARS = 'ABC'
+RESPONSE_CHARS = 'XYZ'
 
-def simulate_correctly(strategy: list[tuple[str, str]]) -> int:
-    strategy = [
-        (Action.from_char(rival), Outcome.from_char(outcome))
-        for rival, outcome in strategy
-    ]
-    expected_shape = reverse_outcome()
-    return sum(
-        expected_shape[rival, outcome].value + outcome.value
-        for rival, outcome in strategy
+# Score of every round indexed by the position of each char in RIVAL_CHARS and RESPONSE_CHARS
+SCORE_TABLE = tuple(
+    tuple(
+        mine.value + GAME_OUTCOME[mine, rival].value
+        for mine in map(Action.from_char, RESPONSE_CHARS)
     )
+    for rival in map(Action.from_char, RIVAL_CHARS)
+)
+CORRECT_SCORE_TABLE = tuple(
+    tuple(
+        EXPECTED_SHAPE[rival, outcome].value + outcome.value
+        for outcome in map(Outcome.from_char, RESPONSE_CHARS)
+    )
+    for rival in map(Action.from_char, RIVAL_CHARS)
+)
+
+
+def table_to_dict(table: tuple[tuple[int, ...], ...]) -> dict[tuple[str, str], int]:
+    return {
+        (rival, response): table[i][j]
+        for i, rival in enumerate(RIVAL_CHARS)
+        for j, response in enumerate(RESPONSE_CHARS)
+    }
+
+
+SCORES = table_to_dict(SCORE_TABLE)
+CORRECT_SCORES = table_to_dict(CORRECT_SCORE_TABLE)
+# Flat position of every kind of round in a histogram
+ROUND_INDEX = table_to_dict(tuple(
+    tuple(3 * i + j for j in range(len(RESPONSE_CHARS)))
+    for i in range(len(RIVAL_CHARS))
+))
+
+
+def decode_bytes(strategy: bytes | memoryview) -> tuple[np.ndarray, np.ndarray]:
+    data = np.frombuffer(strategy, dtype=np.uint8)
+    # Every round takes exactly four bytes, the last one may miss its newline
+    if len(data) % 4 == 3:
+        data = np.append(data, np.uint8(ord('\n')))
+    if len(data) % 4 != 0:
+        raise ValueError('Invalid strategy guide')
+    rounds = data.reshape(-1, 4)
+
+    rivals = rounds[:, 0] - np.uint8(ord(RIVAL_CHARS[0]))
+    responses = rounds[:, 2] - np.uint8(ord(RESPONSE_CHARS[0]))
+    # Unsigned underflow makes chars below A or X invalid too
+    if np.any((rivals > 2) | (responses > 2)):
+        raise ValueError('Invalid strategy guide')
+    if np.any(rounds[:, 1] != ord(' ')) or np.any(rounds[:, 3] != ord('\n')):
+        raise ValueError('Invalid strategy guide')
+
+    return rivals, responses
+
+
+class StrategyHistogram:
+
+    def __init__(self):
+        # Only nine kinds of rounds exist, so counting them is all any scoring needs
+        self._counts = [0] * len(ROUND_INDEX)
+
+    @property
+    def counts(self) -> tuple[tuple[int, ...], ...]:
+        n = len(RESPONSE_CHARS)
+        return tuple(tuple(self._counts[i:i + n]) for i in range(0, len(self._counts), n))
+
+    @property
+    def rounds(self) -> int:
+        return sum(self._counts)
+
+    def add(self, rival: str, response: str, count: int = 1):
+        try:
+            self._counts[ROUND_INDEX[rival, response]] += count
+        except KeyError:
+            raise ValueError(f'Invalid round {(rival, response)}') from None
+
+    def update(self, strategy: Iterable[tuple[str, str]] | bytes | memoryview):
+        if isinstance(strategy, (bytes, memoryview)):
+            rivals, responses = decode_bytes(strategy)
+            counts = np.bincount(rivals * 3 + responses, minlength=len(self._counts))
+            self._counts = [a + int(b) for a, b in zip(self._counts, counts)]
+            return
+
+        for rival, response in strategy:
+            self.add(rival, response)
+
+    def merge(self, other: "StrategyHistogram"):
+        self._counts = [a + b for a, b in zip(self._counts, other._counts)]
+
+    def score(self, table: tuple[tuple[int, ...], ...]) -> int:
+        return sum(
+            count * value
+            for counts, values in zip(self.counts, table)
+            for count, value in zip(counts, values)
+        )
+
+
+def score(strategy: Iterable[tuple[str, str]], scores: dict[tuple[str, str], int]) -> int:
+    try:
+        return sum(scores[game] for game in strategy)
+    except KeyError as e:
+        raise ValueError(f'Invalid round {e.args[0]}') from None
+
+
+def score_bytes(strategy: bytes | memoryview, table: tuple[tuple[int, ...], ...]) -> int:
+    rivals, responses = decode_bytes(strategy)
+    return int(np.array(table, dtype=np.int64)[rivals, responses].sum())
+
+
+Strategy = Iterable[tuple[str, str]] | bytes | memoryview | MappedFile | StrategyHistogram
+
+
+def simulate(strategy: Strategy) -> int:
+    if isinstance(strategy, MappedFile):
+        strategy = strategy.buffer
+    if isinstance(strategy, StrategyHistogram):
+        return strategy.score(SCORE_TABLE)
+    if isinstance(strategy, (bytes, memoryview)):
+        return score_bytes(strategy, SCORE_TABLE)
+    return score(strategy, SCORES)
+
+
+def simulate_correctly(strategy: Strategy) -> int:
+    if isinstance(strategy, MappedFile):
+        strategy = strategy.buffer
+    if isinstance(strategy, StrategyHistogram):
+        return strategy.score(CORRECT_SCORE_TABLE)
+    if isinstance(strategy, (bytes, memoryview)):
+        return score_bytes(strategy, CORRECT_SCORE_TABLE)
+    return score(strategy, CORRECT_SCORES)
 
 
-def read(filename: str) -> list[tuple[str, str]]:
+def read(
+        filename: str,
+        lazy: bool = False,
+        mapped: bool = False,
+        counted: bool = False
+) -> Strategy:
     # Make type hinting work
     def transform(line: str) -> tuple[str, str]:
         a, b = line.split(' ')
         return a, b
 
     path = os.path.join('src', MODULE, 'input', filename)
+    if counted:
+        histogram = StrategyHistogram()
+        with MappedFile(path) as f:
+            histogram.update(f.buffer)
+        return histogram
+    # Mapped files are for the caller to close
+    if mapped:
+        return MappedFile(path)
+    if lazy:
+        return iter_input(path, transform=transform)
     return read_input(path, transform=transform)
 
 
-def solve_part_one(strategy: list[tuple[str, str]]) -> int:
+def solve_part_one(strategy: Strategy) -> int:
     return simulate(strategy)
 
 
-def solve_part_two(strategy: list[tuple[str, str]]) -> int:
+def solve_part_two(strategy: Strategy) -> int:
     return simulate_correctly(strategy)
 
 
@@ -1,48 +1,162 @@
+from __future__ import annotations
+
 import os
-from functools import reduce
+import string
+from typing import Iterable, Iterator, NamedTuple
+
+from src.utils.io import read_lines, iter_lines, MappedFile
+from src.utils.lazy import lazy_import
 
-from src.utils.io import read_lines
+np = lazy_import('numpy')
 
 MODULE = os.path.split(os.path.split(__file__)[0])[1]
 
 
-def get_priority(c: str) -> int:
-    if c.islower():
-        return ord(c) - ord('a') + 1
-    return ord(c) - ord('A') + 27
+class BulkRucksacks(NamedTuple):
+    # Left and right compartment masks of every rucksack
+    left: np.ndarray[np.uint64]
+    right: np.ndarray[np.uint64]
+
+
+def get_priority(c: str | int) -> int:
+    # Items coming from a mapped file are already bytes
+    if isinstance(c, str):
+        c = ord(c)
+    if c >= ord('a'):
+        return c - ord('a') + 1
+    return c - ord('A') + 27
+
+
+# Every item is a single bit, its index being the priority minus one,
+# so sets of items are plain integers. Mapped lines give bytes instead of chars.
+ITEM_BITS: dict[str | int, int] = {
+    key: 1 << (get_priority(c) - 1)
+    for c in string.ascii_letters
+    for key in (c, ord(c))
+}
+
 
+def get_items(items: Iterable[str | int]) -> int:
+    mask = 0
+    try:
+        for item in items:
+            mask |= ITEM_BITS[item]
+    except KeyError as e:
+        raise ValueError(f'Invalid item {e.args[0]!r}') from None
+    return mask
 
-def get_compartments(rucksack: str) -> tuple[set[str], set[str]]:
+
+def get_items_priority(items: int) -> int:
+    if not items:
+        raise ValueError('No common item')
+    return items.bit_length()
+
+
+def get_compartments(rucksack: str | memoryview) -> tuple[int, int]:
     half = len(rucksack) // 2
-    return set(rucksack[:half]), set(rucksack[half:])
+    return get_items(rucksack[:half]), get_items(rucksack[half:])
+
+
+def sum_wrong_priorities(rucksacks: Iterable[str | memoryview] | BulkRucksacks) -> int:
+    # A plain tuple of rucksacks is not bulk data
+    if isinstance(rucksacks, BulkRucksacks):
+        return sum_wrong_priorities_bulk(*rucksacks)
+
+    compartments = (get_compartments(rucksack) for rucksack in rucksacks)
+    return sum(get_items_priority(left & right) for left, right in compartments)
+
+
+def iter_group_badges(rucksacks: Iterable[str | memoryview], n: int) -> Iterator[int]:
+    if n < 1:
+        raise ValueError(f'Groups need at least one rucksack, got {n}')
+
+    # Only the items shared so far by the current group are kept around
+    badge, size = 0, 0
+    for rucksack in rucksacks:
+        items = get_items(rucksack)
+        badge = items if size == 0 else badge & items
+        size += 1
+        if size == n:
+            yield badge
+            size = 0
+
+    if size:
+        raise ValueError(f'The last group only has {size} of {n} rucksacks')
+
+
+def sum_group_badges(rucksacks: Iterable[str | memoryview] | BulkRucksacks, n: int) -> int:
+    if isinstance(rucksacks, BulkRucksacks):
+        return sum_group_badges_bulk(*rucksacks, n=n)
+    return sum(map(get_items_priority, iter_group_badges(rucksacks, n)))
+
+
+def get_bulk_priorities(items: np.ndarray[np.uint64]) -> np.ndarray[np.int64]:
+    if np.any(items == 0):
+        raise ValueError('No common item')
+    # Powers of two below 2 ** 52 are exact in a double
+    return np.log2(items).astype(np.int64) + 1
+
+
+def sum_wrong_priorities_bulk(left: np.ndarray[np.uint64], right: np.ndarray[np.uint64]) -> int:
+    return int(np.sum(get_bulk_priorities(left & right)))
+
+
+def sum_group_badges_bulk(
+        left: np.ndarray[np.uint64],
+        right: np.ndarray[np.uint64],
+        n: int
+) -> int:
+    if len(left) % n != 0:
+        raise ValueError(f'The last group only has {len(left) % n} of {n} rucksacks')
+    badges = np.bitwise_and.reduce((left | right).reshape(-1, n), axis=1)
+    return int(np.sum(get_bulk_priorities(badges)))
 
 
-def sum_wrong_priorities(rucksacks: list[str]) -> int:
-    compartments = [get_compartments(rucksack) for rucksack in rucksacks]
-    wrong_items = [list(left & right)[0] for left, right in compartments]
-    priorities = [get_priority(item) for item in wrong_items]
-    return sum(priorities)
+def read_bulk(path: str) -> BulkRucksacks:
+    data = np.fromfile(path, dtype=np.uint8)
+    if len(data) and data[-1] != ord('\n'):
+        data = np.append(data, np.uint8(ord('\n')))
 
+    # Newlines get no bit, so they vanish when or-ing the items of a compartment
+    bits = np.zeros(256, dtype=np.uint64)
+    for c in string.ascii_letters:
+        bits[ord(c)] = ITEM_BITS[c]
+    items = bits[data]
 
-def sum_group_badges(rucksacks: list[str], n: int) -> int:
-    result = 0
-    for i in range(0, len(rucksacks), n):
-        badge = list(reduce(set.intersection, (set(rucksacks[i + j]) for j in range(n))))[0]
-        result += get_priority(badge)
+    ends = np.flatnonzero(data == ord('\n'))
+    if np.count_nonzero(items) != len(data) - len(ends):
+        raise ValueError('Invalid item')
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    if np.any(ends - starts < 2):
+        raise ValueError('Rucksacks need an item in each compartment')
 
-    return result
+    halves = starts + (ends - starts) // 2
+    compartments = np.bitwise_or.reduceat(items, np.stack((starts, halves), axis=1).ravel())
+    return BulkRucksacks(compartments[0::2], compartments[1::2])
 
 
-def read(filename: str) -> list[str]:
+def read(
+        filename: str,
+        lazy: bool = False,
+        mapped: bool = False,
+        bulk: bool = False
+) -> Iterable[str | memoryview] | BulkRucksacks:
     path = os.path.join('src', MODULE, 'input', filename)
+    if bulk:
+        return read_bulk(path)
+    if lazy:
+        return iter_lines(path)
+    # Mapped files are for the caller to close
+    if mapped:
+        return MappedFile(path)
     return read_lines(path)
 
 
-def solve_part_one(rucksacks: list[str]) -> int:
+def solve_part_one(rucksacks: Iterable[str | memoryview] | BulkRucksacks) -> int:
     return sum_wrong_priorities(rucksacks)
 
 
-def solve_part_two(rucksacks: list[str]) -> int:
+def solve_part_two(rucksacks: Iterable[str | memoryview] | BulkRucksacks) -> int:
     return sum_group_badges(rucksacks, n=3)
 
 
@@ -1,11 +1,30 @@
+from __future__ import annotations
+
 import os
+from bisect import bisect_left
+from itertools import chain
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, NamedTuple, Sequence
+
+from src.utils.io import read_input, iter_input, read_int_columns
+from src.utils.lazy import lazy_import
 
-from src.utils.io import read_input
+np = lazy_import('numpy')
 
 MODULE = os.path.split(os.path.split(__file__)[0])[1]
 
 
+class BulkRanges(NamedTuple):
+    # Columns of the bounds of every pair
+    start1: np.ndarray[np.int32]
+    end1: np.ndarray[np.int32]
+    start2: np.ndarray[np.int32]
+    end2: np.ndarray[np.int32]
+
+
 class Interval:
+    # Millions of them get created, and without a __dict__ each one takes about half the memory
+    __slots__ = ('_start', '_end')
 
     def __init__(self, start: int, end: int):
         assert start <= end
@@ -13,6 +32,14 @@ class Interval:
         self._start = start
         self._end = end
 
+    @classmethod
+    def validated(cls, start: int, end: int) -> "Interval":
+        # For bounds already checked in bulk
+        interval = cls.__new__(cls)
+        interval._start = start
+        interval._end = end
+        return interval
+
     @property
     def start(self) -> int:
         return self._start
@@ -28,15 +55,180 @@ class Interval:
         return self.start <= other.end <= self.end or other.start <= self.end <= other.end
 
 
-def count_complete_overlapping(ranges: list[tuple[Interval, Interval]]) -> int:
+@dataclass(frozen=True)
+class IntervalNode:
+    center: int = field()
+    # Intervals containing the center, sorted by start and by decreasing end
+    by_start: list[Interval] = field()
+    by_end: list[Interval] = field()
+    left: "IntervalNode | None" = field(default=None)
+    right: "IntervalNode | None" = field(default=None)
+
+
+def build_interval_tree(intervals: list[Interval]) -> IntervalNode | None:
+    if not intervals:
+        return None
+
+    # The median endpoint leaves at most half of the endpoints on each side
+    endpoints = sorted(p for interval in intervals for p in (interval.start, interval.end))
+    center = endpoints[len(endpoints) // 2]
+
+    left = [interval for interval in intervals if interval.end < center]
+    right = [interval for interval in intervals if interval.start > center]
+    middle = [interval for interval in intervals if interval.start <= center <= interval.end]
+    return IntervalNode(
+        center,
+        sorted(middle, key=lambda interval: interval.start),
+        sorted(middle, key=lambda interval: interval.end, reverse=True),
+        build_interval_tree(left),
+        build_interval_tree(right)
+    )
+
+
+class IntervalIndex:
+
+    def __init__(self, intervals: Iterable[Interval]):
+        self._intervals = list(intervals)
+        self._root = build_interval_tree(self._intervals)
+        self._starts = sorted(interval.start for interval in self._intervals)
+        self._ends = sorted(interval.end for interval in self._intervals)
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def iter_overlapping(self, query: Interval) -> Iterator[Interval]:
+        nodes = [self._root] if self._root is not None else []
+        while nodes:
+            node = nodes.pop()
+            if query.end < node.center:
+                # Only intervals starting early enough can reach the query
+                for interval in node.by_start:
+                    if interval.start > query.end:
+                        break
+                    yield interval
+                if node.left is not None:
+                    nodes.append(node.left)
+            elif query.start > node.center:
+                for interval in node.by_end:
+                    if interval.end < query.start:
+                        break
+                    yield interval
+                if node.right is not None:
+                    nodes.append(node.right)
+            else:
+                # The query covers the center, and so does everything stored here
+                yield from node.by_start
+                nodes.extend(child for child in (node.left, node.right) if child is not None)
+
+    def overlapping(self, query: Interval) -> list[Interval]:
+        return list(self.iter_overlapping(query))
+
+    def containing(self, query: Interval) -> list[Interval]:
+        return [interval for interval in self.iter_overlapping(query) if query.is_subset(interval)]
+
+    def contained_in(self, query: Interval) -> list[Interval]:
+        return [interval for interval in self.iter_overlapping(query) if interval.is_subset(query)]
+
+    def count_overlapping(self, query: Interval) -> int:
+        # Everything but what ends before or starts after the query
+        ends_before = bisect_left(self._ends, query.start)
+        starts_after = len(self._starts) - bisect_left(self._starts, query.end + 1)
+        return len(self._intervals) - ends_before - starts_after
+
+    def count_overlapping_pairs(self) -> int:
+        # Sweeping by start, the i-th interval overlaps every earlier one that has not ended yet,
+        # and whatever ends before it starts necessarily started earlier too
+        return sum(i - bisect_left(self._ends, start) for i, start in enumerate(self._starts))
+
+
+class IntervalArray(Sequence[Interval]):
+
+    def __init__(self, starts: np.ndarray[np.int32], ends: np.ndarray[np.int32]):
+        # Two int32 columns take 8 bytes per interval, objects only exist while in use
+        self._starts = np.ascontiguousarray(starts, dtype=np.int32)
+        self._ends = np.ascontiguousarray(ends, dtype=np.int32)
+        if len(self._starts) != len(self._ends):
+            raise ValueError('Every interval needs a start and an end')
+        if np.any(self._starts > self._ends):
+            raise ValueError('Intervals cannot end before they start')
+
+    @property
+    def starts(self) -> np.ndarray[np.int32]:
+        return self._starts
+
+    @property
+    def ends(self) -> np.ndarray[np.int32]:
+        return self._ends
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index: int) -> Interval:
+        return Interval.validated(int(self._starts[index]), int(self._ends[index]))
+
+    def __iter__(self) -> Iterator[Interval]:
+        return map(Interval.validated, self._starts.tolist(), self._ends.tolist())
+
+
+def pairs_from_columns(
+        start1: np.ndarray[np.int32],
+        end1: np.ndarray[np.int32],
+        start2: np.ndarray[np.int32],
+        end2: np.ndarray[np.int32]
+) -> list[tuple[Interval, Interval]]:
+    return list(zip(IntervalArray(start1, end1), IntervalArray(start2, end2)))
+
+
+def index_intervals(ranges: Iterable[tuple[Interval, Interval]]) -> IntervalIndex:
+    return IntervalIndex(chain.from_iterable(ranges))
+
+
+def count_complete_overlapping(ranges: Iterable[tuple[Interval, Interval]] | BulkRanges) -> int:
+    # A plain tuple of pairs is not bulk data
+    if isinstance(ranges, BulkRanges):
+        return count_complete_overlapping_bulk(*ranges)
     return sum(1 for one, other in ranges if one.is_subset(other) or other.is_subset(one))
 
 
-def count_overlaps(ranges: list[tuple[Interval, Interval]]) -> int:
+def count_overlaps(ranges: Iterable[tuple[Interval, Interval]] | BulkRanges) -> int:
+    if isinstance(ranges, BulkRanges):
+        return count_overlaps_bulk(*ranges)
     return sum(1 for one, other in ranges if one.intersects(other))
 
 
-def read(filename: str) -> list[tuple[Interval, Interval]]:
+def count_complete_overlapping_bulk(
+        start1: np.ndarray[np.int32],
+        end1: np.ndarray[np.int32],
+        start2: np.ndarray[np.int32],
+        end2: np.ndarray[np.int32]
+) -> int:
+    first_in_second = (start2 <= start1) & (end1 <= end2)
+    second_in_first = (start1 <= start2) & (end2 <= end1)
+    return int(np.count_nonzero(first_in_second | second_in_first))
+
+
+def count_overlaps_bulk(
+        start1: np.ndarray[np.int32],
+        end1: np.ndarray[np.int32],
+        start2: np.ndarray[np.int32],
+        end2: np.ndarray[np.int32]
+) -> int:
+    return int(np.count_nonzero((start1 <= end2) & (start2 <= end1)))
+
+
+def read_bulk(path: str) -> BulkRanges:
+    columns = read_int_columns(path, b'-,-').astype(np.int32).T
+    start1, end1, start2, end2 = map(np.ascontiguousarray, columns)
+    if np.any(start1 > end1) or np.any(start2 > end2):
+        raise ValueError('Intervals cannot end before they start')
+    return BulkRanges(start1, end1, start2, end2)
+
+
+def read(
+        filename: str,
+        lazy: bool = False,
+        bulk: bool = False
+) -> Iterable[tuple[Interval, Interval]] | BulkRanges:
     def transform(line: str) -> tuple[Interval, Interval]:
         elf1, elf2 = line.split(',')
         start1, end1 = elf1.split('-')
@@ -44,14 +236,18 @@ def read(filename: str) -> list[tuple[Interval, Interval]]:
         return Interval(int(start1), int(end1)), Interval(int(start2), int(end2))
 
     path = os.path.join('src', MODULE, 'input', filename)
+    if bulk:
+        return read_bulk(path)
+    if lazy:
+        return iter_input(path, transform=transform)
     return read_input(path, transform=transform)
 
 
-def solve_part_one(ranges: list[tuple[Interval, Interval]]) -> int:
+def solve_part_one(ranges: Iterable[tuple[Interval, Interval]] | BulkRanges) -> int:
     return count_complete_overlapping(ranges)
 
 
-def solve_part_two(ranges: list[tuple[Interval, Interval]]) -> int:
+def solve_part_two(ranges: Iterable[tuple[Interval, Interval]] | BulkRanges) -> int:
     return count_overlaps(ranges)
 
 
@@ -1,13 +1,24 @@
+from __future__ import annotations
+
 import os
 import re
-import copy
+import random
 from dataclasses import dataclass, field
-from typing import Iterable
+from typing import Iterable, Iterator, Sequence
+
+from src.utils.io import read_lines, iter_line_chunks, parse_ints
+from src.utils.lazy import lazy_import
 
-from src.utils.io import read_lines
+np = lazy_import('numpy')
 
 MODULE = os.path.split(os.path.split(__file__)[0])[1]
 
+# What is left of a move line once its numbers are gone
+MOVE_LAYOUT = b'move  from  to \n'
+
+# Bulk moves are turned into Python ints this many rows at a time
+MOVE_BLOCK = 1 << 16
+
 
 @dataclass(frozen=True)
 class Move:
@@ -16,27 +27,265 @@ class Move:
     to_stack: int = field()
 
 
+# Bulk moves are rows of count, from and to
+StackMoves = tuple[dict[int, list[str]], 'list[Move] | np.ndarray[np.int32]']
+
+
+class CrateNode:
+    # Implicit treap node: its position is the size of everything on its left
+    __slots__ = ('crate', 'priority', 'size', 'left', 'right', 'flipped')
+
+    def __init__(self, crate: str, priority: float):
+        self.crate = crate
+        self.priority = priority
+        self.size = 1
+        self.left: CrateNode | None = None
+        self.right: CrateNode | None = None
+        # Pending reversal of the whole subtree
+        self.flipped = False
+
+    def push(self):
+        if self.flipped:
+            self.left, self.right = self.right, self.left
+            for child in (self.left, self.right):
+                if child is not None:
+                    child.flipped = not child.flipped
+            self.flipped = False
+
+    def update(self):
+        self.size = 1 + size(self.left) + size(self.right)
+
+
+def size(node: CrateNode | None) -> int:
+    return node.size if node is not None else 0
+
+
+def split(node: CrateNode | None, count: int) -> tuple[CrateNode | None, CrateNode | None]:
+    # The first count crates from the bottom, and the rest
+    if node is None:
+        return None, None
+    if node.flipped:
+        node.push()
+    left_size = size(node.left)
+    if left_size >= count:
+        left, node.left = split(node.left, count)
+        node.size -= size(left)
+        return left, node
+    node.right, right = split(node.right, count - left_size - 1)
+    node.size -= size(right)
+    return node, right
+
+
+def merge(bottom: CrateNode | None, top: CrateNode | None) -> CrateNode | None:
+    if bottom is None:
+        return top
+    if top is None:
+        return bottom
+    if bottom.priority > top.priority:
+        if bottom.flipped:
+            bottom.push()
+        bottom.size += top.size
+        bottom.right = merge(bottom.right, top)
+        return bottom
+    if top.flipped:
+        top.push()
+    top.size += bottom.size
+    top.left = merge(bottom, top.left)
+    return top
+
+
+class CrateStack(Sequence[str]):
+
+    def __init__(self, crates: Iterable[str] = (), rng: random.Random = None):
+        self._rng = rng or random.Random(0)
+        self._root = self._build(crates)
+
+    @property
+    def top(self) -> str:
+        node = self._root
+        if node is None:
+            raise ValueError('The stack is empty')
+        node.push()
+        while node.right is not None:
+            node = node.right
+            node.push()
+        return node.crate
+
+    def take(self, count: int, reverse: bool = True) -> CrateNode | None:
+        if not 0 <= count <= len(self):
+            raise ValueError(f'Cannot take {count} crates from a stack of {len(self)}')
+        self._root, block = split(self._root, len(self) - count)
+        # Crates come off one at a time, flipping the block only marks its root
+        if reverse and block is not None:
+            block.flipped = not block.flipped
+        return block
+
+    def put(self, block: CrateNode | None):
+        self._root = merge(self._root, block)
+
+    def __len__(self) -> int:
+        return size(self._root)
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        node = self._root
+        while True:
+            node.push()
+            if index < size(node.left):
+                node = node.left
+            elif index == size(node.left):
+                return node.crate
+            else:
+                index -= size(node.left) + 1
+                node = node.right
+
+    def __iter__(self) -> Iterator[str]:
+        nodes = []
+        node = self._root
+        while nodes or node is not None:
+            if node is not None:
+                node.push()
+                nodes.append(node)
+                node = node.left
+            else:
+                node = nodes.pop()
+                yield node.crate
+                node = node.right
+
+    def _build(self, crates: Iterable[str]) -> CrateNode | None:
+        # Cartesian tree in linear time: the right spine holds what the next crate may go under
+        spine = []
+        for crate in crates:
+            node = CrateNode(crate, self._rng.random())
+            last = None
+            while spine and spine[-1].priority < node.priority:
+                last = spine.pop()
+                last.update()
+            node.left = last
+            if spine:
+                spine[-1].right = node
+            spine.append(node)
+
+        root = spine[0] if spine else None
+        # Sizes along the spine are only known once nothing else can hang below it
+        while spine:
+            spine.pop().update()
+        return root
+
+
+def iter_move_rows(
+        moves: Iterable[Move] | np.ndarray[np.int32],
+        block_size: int = MOVE_BLOCK
+) -> Iterator[tuple[int, int, int]]:
+    # Bulk moves are rows of count, from and to, turned into ints a block at a time
+    if hasattr(moves, 'tolist'):
+        for start in range(0, len(moves), block_size):
+            yield from moves[start:start + block_size].tolist()
+    else:
+        for move in moves:
+            yield move.count, move.from_stack, move.to_stack
+
+
+def iter_move_rows_backwards(
+        moves: Sequence[Move] | np.ndarray[np.int32],
+        block_size: int = MOVE_BLOCK
+) -> Iterator[tuple[int, int, int]]:
+    if hasattr(moves, 'tolist'):
+        for end in range(len(moves), 0, -block_size):
+            yield from reversed(moves[max(end - block_size, 0):end].tolist())
+    else:
+        for move in reversed(moves):
+            yield move.count, move.from_stack, move.to_stack
+
+
 def simulate(
         stacks: dict[int, list[str]],
-        moves: list[Move],
+        moves: Iterable[Move] | np.ndarray[np.int32],
         reverse: bool = True
-) -> dict[int, list[str]]:
-    def pick(elements: list[str]) -> Iterable[str]:
-        if reverse:
-            return reversed(elements)
-        return elements
-
-    stacks = copy.deepcopy(stacks)
-    for move in moves:
-        from_stack = stacks[move.from_stack]
-        to_stack = stacks[move.to_stack]
-        taken = pick(from_stack[-move.count:])
-        to_stack.extend(taken)
-        del from_stack[-move.count:]
+) -> dict[int, CrateStack]:
+    # Moving a block is a split and a merge, whatever its size and orientation
+    rng = random.Random(0)
+    stacks = {index: CrateStack(stack, rng) for index, stack in stacks.items()}
+    for count, from_stack, to_stack in iter_move_rows(moves):
+        # Crates moved onto their own stack end up where they were
+        if from_stack != to_stack:
+            stacks[to_stack].put(stacks[from_stack].take(count, reverse))
     return stacks
 
 
-def read(filename: str) -> tuple[dict[int, list[str]], list[Move]]:
+def trace_tops(
+        stacks: dict[int, list[str]],
+        moves: Iterable[Move] | np.ndarray[np.int32],
+        reverse: bool = True
+) -> dict[int, str]:
+    # Moves are walked twice, forwards and then backwards, so only one-shot iterables are copied
+    if not hasattr(moves, 'tolist') and not isinstance(moves, Sequence):
+        moves = list(moves)
+    heights = {index: len(stack) for index, stack in stacks.items()}
+    for count, from_stack, to_stack in iter_move_rows(moves):
+        if not 0 <= count <= heights[from_stack]:
+            raise ValueError(f'Cannot take {count} crates from a stack of {heights[from_stack]}')
+        if from_stack != to_stack:
+            heights[from_stack] -= count
+            heights[to_stack] += count
+
+    # Only the crates ending on top are followed back, by position in a stack to final stack
+    tracked = {index: {} for index in stacks}
+    for index, height in heights.items():
+        if height:
+            tracked[index][height - 1] = index
+
+    for count, from_stack, to_stack in iter_move_rows_backwards(moves):
+        if from_stack == to_stack:
+            continue
+        # Heights before the move, nothing below them was touched
+        heights[from_stack] += count
+        heights[to_stack] -= count
+        from_height, to_height = heights[from_stack], heights[to_stack]
+
+        staying = {}
+        for position, owner in tracked[to_stack].items():
+            if position < to_height:
+                staying[position] = owner
+            elif reverse:
+                tracked[from_stack][from_height - 1 - (position - to_height)] = owner
+            else:
+                tracked[from_stack][from_height - count + (position - to_height)] = owner
+        tracked[to_stack] = staying
+
+    return {
+        owner: stacks[index][position]
+        for index, positions in tracked.items()
+        for position, owner in positions.items()
+    }
+
+
+def read_moves_bulk(path: str, start: int) -> np.ndarray[np.int32]:
+    moves = [np.zeros((0, 3), dtype=np.int32)]
+    for chunk in iter_line_chunks(path, start=start):
+        if not chunk.endswith(b'\n'):
+            chunk += b'\n'
+        # Checking the words all at once, the numbers are then all that is left to parse
+        lines = chunk.count(b'\n')
+        values = parse_ints(chunk)
+        if chunk.translate(None, b'0123456789') != MOVE_LAYOUT * lines or len(values) != 3 * lines:
+            raise ValueError('Every move must look like: move <count> from <stack> to <stack>')
+        moves.append(values.reshape(-1, 3).astype(np.int32))
+    return np.concatenate(moves)
+
+
+def get_tops(stacks: dict[int, Sequence[str]]) -> str:
+    return ''.join(stack[-1] if stack else '' for _, stack in sorted(stacks.items()))
+
+
+def read(
+        filename: str,
+        bulk: bool = False
+) -> StackMoves:
     def read_stacks(it: Iterable[str]) -> dict[int, list[str]]:
         crate_re = re.compile(r'\[\w]')
         crates = []
@@ -71,19 +320,33 @@ def read(filename: str) -> tuple[dict[int, list[str]], list[Move]]:
         return moves
 
     path = os.path.join('src', MODULE, 'input', filename)
+    if bulk:
+        # Only the drawing goes through the regular expressions
+        drawing = []
+        start = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                start += len(line)
+                drawing.append(line.decode().rstrip('\n'))
+                if drawing[-1] == '':
+                    break
+        return read_stacks(drawing), read_moves_bulk(path, start)
+
     data = read_lines(path)
     iterable = iter(data)
     return read_stacks(iterable), read_moves(iterable)
 
 
-def solve_part_one(stack_moves: tuple[dict[int, list[str]], list[Move]]) -> str:
-    stacks = simulate(*stack_moves)
-    return ''.join(stack[-1] if stacks else '' for _, stack in sorted(stacks.items()))
+def solve_part_one(stack_moves: StackMoves) -> str:
+    stacks, moves = stack_moves
+    tops = trace_tops(stacks, moves)
+    return ''.join(tops.get(index, '') for index in sorted(stacks))
 
 
-def solve_part_two(stack_moves: tuple[dict[int, list[str]], list[Move]]) -> str:
-    stacks = simulate(*stack_moves, reverse=False)
-    return ''.join(stack[-1] if stacks else '' for _, stack in sorted(stacks.items()))
+def solve_part_two(stack_moves: StackMoves) -> str:
+    stacks, moves = stack_moves
+    tops = trace_tops(stacks, moves, reverse=False)
+    return ''.join(tops.get(index, '') for index in sorted(stacks))
 
 
 def main():
@@ -1,56 +1,127 @@
 import os
-from collections import Counter
+from typing import BinaryIO, Iterable, Iterator
 
-from src.utils.io import read_all
+from src.utils.io import read_all, MappedFile
 
 MODULE = os.path.split(os.path.split(__file__)[0])[1]
 
-
-class NoZeroCounter(Counter):
-
-    def __setitem__(self, key, value):
-        super().__setitem__(key, value)
-        if self[key] == 0:
-            del self[key]
-
-
-def find_marker(buffer: str, marker_size: int) -> int:
-    counter = NoZeroCounter(buffer[:marker_size])
-    if len(counter) == marker_size:
-        return marker_size
-
-    for i in range(marker_size, len(buffer)):
-        subs = i - marker_size
-        counter[buffer[subs]] -= 1
-        counter[buffer[i]] += 1
-
-        if len(counter) == marker_size:
-            return i + 1
-
-    raise ValueError
-
-
-def read(filename: str) -> str:
+Buffer = str | bytes | memoryview | MappedFile
+
+
+def as_bytes(buffer: Buffer) -> bytes | memoryview:
+    if isinstance(buffer, MappedFile):
+        return buffer.buffer
+    if not isinstance(buffer, str):
+        return buffer
+    try:
+        return buffer.encode('latin-1')
+    except UnicodeEncodeError:
+        raise ValueError('Only single byte characters are supported') from None
+
+
+def find_markers(buffer: Buffer, marker_sizes: Iterable[int]) -> dict[int, int]:
+    # Runs of distinct bytes only grow one at a time, so sizes are reached in increasing order
+    pending = sorted(set(marker_sizes))
+    markers = {}
+    if not pending:
+        return markers
+    if pending[0] < 1:
+        raise ValueError(f'Markers need at least one byte, got {pending[0]}')
+
+    # Last position of every byte value, and where the current run of distinct bytes starts
+    last_seen = [-1] * 256
+    start = 0
+    for i, c in enumerate(as_bytes(buffer)):
+        # Skip past the previous copy, which may already be out of the window
+        if last_seen[c] >= start:
+            start = last_seen[c] + 1
+        last_seen[c] = i
+        if i - start + 1 >= pending[0]:
+            while pending and i - start + 1 >= pending[0]:
+                markers[pending.pop(0)] = i + 1
+            if not pending:
+                return markers
+
+    raise ValueError(f'No marker of size {pending[0]}')
+
+
+def find_marker(buffer: Buffer, marker_size: int) -> int:
+    return find_markers(buffer, [marker_size])[marker_size]
+
+
+class MarkerDetector:
+
+    def __init__(self, marker_size: int):
+        if marker_size < 1:
+            raise ValueError(f'Markers need at least one byte, got {marker_size}')
+        self._marker_size = marker_size
+        # The whole window state, so memory stays the same however long the stream is
+        self._last_seen = [-1] * 256
+        self._start = 0
+        self._position = 0
+
+    @property
+    def marker_size(self) -> int:
+        return self._marker_size
+
+    @property
+    def position(self) -> int:
+        return self._position
+
+    def feed(self, chunk: str | bytes | memoryview) -> list[int]:
+        # End offset, counted from the start of the stream, of every window of distinct bytes
+        markers = []
+        last_seen, start, marker_size = self._last_seen, self._start, self._marker_size
+        for i, c in enumerate(as_bytes(chunk), self._position):
+            if last_seen[c] >= start:
+                start = last_seen[c] + 1
+            last_seen[c] = i
+            if i - start + 1 >= marker_size:
+                markers.append(i + 1)
+
+        self._start = start
+        self._position += len(chunk)
+        return markers
+
+
+def iter_markers(chunks: Iterable[str | bytes | memoryview], marker_size: int) -> Iterator[int]:
+    detector = MarkerDetector(marker_size)
+    for chunk in chunks:
+        yield from detector.feed(chunk)
+
+
+def iter_stream_markers(
+        stream: BinaryIO,
+        marker_size: int,
+        chunk_size: int = 1 << 16
+) -> Iterator[int]:
+    # Anything with a read method works: files, pipes or sockets through makefile
+    return iter_markers(iter(lambda: stream.read(chunk_size), b''), marker_size)
+
+
+def read(filename: str, mapped: bool = False) -> str | MappedFile:
     path = os.path.join('src', MODULE, 'input', filename)
+    # Mapped files are for the caller to close
+    if mapped:
+        return MappedFile(path)
     return read_all(path)
 
 
-def solve_part_one(buffer: str) -> int:
+def solve_part_one(buffer: Buffer) -> int:
     return find_marker(buffer, 4)
 
 
-def solve_part_two(buffer: str) -> int:
+def solve_part_two(buffer: Buffer) -> int:
     return find_marker(buffer, 14)
 
 
 def main():
     data = read('input.txt')
 
-    result_one = solve_part_one(data)
-    print(result_one)
-
-    result_two = solve_part_two(data)
-    print(result_two)
+    # Both parts come out of the same scan
+    markers = find_markers(data, [4, 14])
+    print(markers[4])
+    print(markers[14])
 
 
 if __name__ == '__main__':
@@ -1,6 +1,11 @@
+from __future__ import annotations
+
 import os
 
-import numpy as np
+from src.utils.io import MappedFile
+from src.utils.lazy import lazy_import
+
+np = lazy_import('numpy')
 
 MODULE = os.path.split(os.path.split(__file__)[0])[1]
 
@@ -71,11 +76,37 @@ def scenic_score(grid: np.ndarray[np.int32]) -> np.ndarray[np.int32]:
     return up * left * down * right
 
 
-def read(filename: str) -> np.ndarray[np.int32]:
+def read(filename: str, mapped: bool = False) -> np.ndarray[np.int32]:
     path = os.path.join('src', MODULE, 'input', filename)
+    if mapped:
+        return read_mapped(path)
     return np.genfromtxt(path, dtype=np.int32, delimiter=1)
 
 
+def read_mapped(path: str) -> np.ndarray[np.int32]:
+    with MappedFile(path) as mapped:
+        rows = len(mapped)
+        # An empty file has no first row to take the width from
+        cols = mapped.line_span(0)[1] if rows else 0
+        if not cols:
+            raise ValueError('The grid needs at least one tree')
+        size = len(mapped.buffer)
+        # The last row may or may not end with a newline
+        if size not in (rows * (cols + 1), rows * (cols + 1) - 1):
+            raise ValueError('All rows must have the same length')
+        # Rows of other lengths can still add up to the same total
+        if not np.array_equal(mapped.newlines, np.arange(cols, size, cols + 1)):
+            raise ValueError('All rows must have the same length')
+
+        # Skip newlines without copying by striding over the mapped bytes
+        digits = np.frombuffer(mapped.buffer, dtype=np.uint8)
+        grid = np.lib.stride_tricks.as_strided(digits, shape=(rows, cols), strides=(cols + 1, 1))
+        result = np.subtract(grid, ord('0'), dtype=np.int32)
+        # The mapping cannot be closed while arrays still point into it
+        del digits, grid
+    return result
+
+
 def solve_part_one(grid: np.ndarray[np.int32]) -> int:
     return len(visible_trees(grid))
 
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import os
 import math
-from typing import Literal
+from typing import Literal, Iterable
 from itertools import pairwise
 
-from src.utils.io import read_input
+from src.utils.io import read_input, iter_input
+from src.utils.profiling import phase
 
 MODULE = os.path.split(os.path.split(__file__)[0])[1]
 
@@ -88,6 +89,8 @@ ZERO = Vector(0, 0)
 # Actually it should be <= pi / 4, but check < pi / 2 just in case
 PI_HALF = math.pi / 2
 
+MOVE_PHASE = phase('day09.rope.move')
+
 
 class Rope:
 
@@ -128,34 +131,41 @@ class Rope:
             self._knots[i + 1] += v
 
 
+@phase('day09.get_trajectory')
 def get_trajectory(
         rope: Rope,
-        moves: list[tuple[Literal["L", "U", 'R', "D"], int]]
+        moves: Iterable[tuple[Literal["L", "U", 'R', "D"], int]]
 ) -> list[Vector]:
     trajectory = [rope.head]
+    move = MOVE_PHASE.bind(rope.move)
 
     for direction, length in moves:
         for _ in range(length):
-            rope.move(direction)
+            move(direction)
             trajectory.append(rope.tail)
 
     return trajectory
 
 
-def read(filename: str) -> list[tuple[Literal["L", "U", 'R', "D"], int]]:
+def read(
+        filename: str,
+        lazy: bool = False
+) -> Iterable[tuple[Literal["L", "U", 'R', "D"], int]]:
     def transform(line: str) -> tuple[Literal["L", "U", 'R', "D"], int]:
         d, n = line.split()
         return d, int(n)
 
     path = os.path.join('src', MODULE, 'input', filename)
+    if lazy:
+        return iter_input(path, transform=transform)
     return read_input(path, transform=transform)
 
 
-def solve_part_one(moves: list[tuple[Literal["L", "U", 'R', "D"], int]]) -> int:
+def solve_part_one(moves: Iterable[tuple[Literal["L", "U", 'R', "D"], int]]) -> int:
     return len(set(get_trajectory(Rope(), moves)))
 
 
-def solve_part_two(moves: list[tuple[Literal["L", "U", 'R', "D"], int]]) -> int:
+def solve_part_two(moves: Iterable[tuple[Literal["L", "U", 'R', "D"], int]]) -> int:
     return len(set(get_trajectory(Rope(10), moves)))
 
 
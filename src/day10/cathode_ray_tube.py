@@ -1,7 +1,8 @@
 import abc
 import os
+from typing import Iterable
 
-from src.utils.io import read_input
+from src.utils.io import read_input, iter_input
 
 MODULE = os.path.split(os.path.split(__file__)[0])[1]
 
@@ -111,30 +112,32 @@ class CPU:
         self._cycle += instruction.cycles
 
 
-def run_instructions(cpu: CPU, instructions: list[Instruction]) -> list[int]:
+def run_instructions(cpu: CPU, instructions: Iterable[Instruction]) -> list[int]:
     for instruction in instructions:
         cpu.apply(instruction)
 
     return cpu.history
 
 
-def read(filename: str) -> list[Instruction]:
+def read(filename: str, lazy: bool = False) -> Iterable[Instruction]:
     def transform(line: str) -> Instruction:
         if line == 'noop':
             return Noop()
         return Addx(int(line.split()[-1]))
 
     path = os.path.join('src', MODULE, 'input', filename)
+    if lazy:
+        return iter_input(path, transform=transform)
     return read_input(path, transform=transform)
 
 
-def solve_part_one(instructions: list[Instruction]) -> int:
+def solve_part_one(instructions: Iterable[Instruction]) -> int:
     history = run_instructions(CPU(), instructions)
     cycles = (20, 60, 100, 140, 180, 220)
     return sum(c * history[c - 1] for c in cycles)
 
 
-def solve_part_two(instructions: list[Instruction]) -> str:
+def solve_part_two(instructions: Iterable[Instruction]) -> str:
     crt = CRT(COLUMNS)
     run_instructions(CPU(crt), instructions)
     return crt.draw()
@@ -7,9 +7,26 @@ from typing import Callable, Any
 from functools import reduce
 
 from src.utils.io import read_multi_input
+from src.utils.profiling import phase
 
 MODULE = os.path.split(os.path.split(__file__)[0])[1]
 
+INSPECT_PHASE = phase('day11.monkey.do_monkey_stuff')
+CALLBACK_PHASE = phase('day11.callback')
+
+
+@dataclass(frozen=True)
+class Operation:
+    operator: Callable[[int, int], int] = field()
+    # None stands for the old value
+    lhs: int | None = field()
+    rhs: int | None = field()
+
+    def __call__(self, x: int) -> int:
+        lhs = x if self.lhs is None else self.lhs
+        rhs = x if self.rhs is None else self.rhs
+        return self.operator(lhs, rhs)
+
 
 @dataclass(frozen=True)
 class MonkeyData:
@@ -48,8 +65,9 @@ class Monkey:
         self._items.append(item)
 
     def do_monkey_stuff(self):
+        inspect = INSPECT_PHASE.bind(self._do_monkey_stuff)
         while self._items:
-            self._do_monkey_stuff()
+            inspect()
             self._item_inspection_count += 1
 
     def _do_monkey_stuff(self):
@@ -59,6 +77,7 @@ class Monkey:
             self._callback(new_item)
 
 
+@phase('day11.get_monkey_business')
 def get_monkey_business(monkeys: list[Monkey], rounds: int, n: int) -> int:
     for _ in range(rounds):
         for monkey in monkeys:
@@ -69,7 +88,7 @@ def get_monkey_business(monkeys: list[Monkey], rounds: int, n: int) -> int:
 
 
 def read(filename: str) -> tuple[list[MonkeyData], list[MonkeyTest]]:
-    def extract_operation(op_str: str) -> Callable[[int], int]:
+    def extract_operation(op_str: str) -> Operation:
         op = op_str.split('= ')[-1]
         lhs, o, rhs = op.split(' ')
 
@@ -79,12 +98,11 @@ def read(filename: str) -> tuple[list[MonkeyData], list[MonkeyTest]]:
             '*': operator.mul
         }[o]
 
-        def f(x: int) -> int:
-            lhs_ = x if lhs == 'old' else int(lhs)
-            rhs_ = x if rhs == 'old' else int(rhs)
-            return operator_fun(lhs_, rhs_)
-
-        return f
+        return Operation(
+            operator_fun,
+            None if lhs == 'old' else int(lhs),
+            None if rhs == 'old' else int(rhs)
+        )
 
     path = os.path.join('src', MODULE, 'input', filename)
     monkey_info = read_multi_input(path)
@@ -121,7 +139,8 @@ def solve_part_one(data: tuple[list[MonkeyData], list[MonkeyTest]]) -> int:
         return f
 
     for monkey, test in zip(monkeys, tests):
-        monkey.callback = after_operation(test.divisor, test.true_id, test.false_id)
+        callback = after_operation(test.divisor, test.true_id, test.false_id)
+        monkey.callback = CALLBACK_PHASE.bind(callback)
 
     return get_monkey_business(monkeys, rounds=20, n=2)
 
@@ -142,7 +161,8 @@ def solve_part_two(data: tuple[list[MonkeyData], list[MonkeyTest]]) -> int:
         return f
 
     for monkey, test in zip(monkeys, tests):
-        monkey.callback = after_operation(test.divisor, test.true_id, test.false_id)
+        callback = after_operation(test.divisor, test.true_id, test.false_id)
+        monkey.callback = CALLBACK_PHASE.bind(callback)
 
     return get_monkey_business(monkeys, rounds=10_000, n=2)
 
@@ -1,9 +1,11 @@
 import os
 from typing import Iterable, Callable, Literal
 
-import numpy as np
-
 from src.utils.io import read_lines
+from src.utils.lazy import lazy_import
+from src.utils.profiling import phase
+
+np = lazy_import('numpy')
 
 MODULE = os.path.split(os.path.split(__file__)[0])[1]
 
@@ -12,6 +14,8 @@ END = 'E'
 LOWEST = 'a'
 HIGHEST = 'z'
 
+QUEUE_PHASE = phase('day12.climb.queue')
+
 
 class Hill:
 
@@ -53,6 +57,7 @@ class Hill:
         return self._heights[item]
 
 
+@phase('day12.climb')
 def climb(
         hill: Hill,
         start: tuple[int, int] = None,
@@ -76,6 +81,8 @@ def climb(
 
     queue = [start]
     paths = {start: None}
+    pop = QUEUE_PHASE.bind(queue.pop)
+    push = QUEUE_PHASE.bind(queue.append)
 
     def get_path(x: tuple[int, int]) -> list[tuple[int, int]]:
         path = []
@@ -85,7 +92,7 @@ def climb(
         return list(reversed(path))
 
     while queue:
-        p = queue.pop(0)
+        p = pop(0)
 
         if _end(p):
             return get_path(p)
@@ -96,7 +103,7 @@ def climb(
 
             if is_valid(p, q):
                 paths[q] = p
-                queue.append(q)
+                push(q)
 
     raise ValueError()
 
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import os
 import json
+from typing import Iterable
 from functools import cmp_to_key
 
-from src.utils.io import read_multi_input
+from src.utils.io import read_multi_input, iter_multi_input
 from src.utils.list_helpers import flatten
 
 MODULE = os.path.split(os.path.split(__file__)[0])[1]
@@ -43,12 +44,14 @@ def compare(left: list[list_or_int], right: list[list_or_int]) -> int:
     return EQ
 
 
-def read(filename: str) -> list[list[list[list_or_int]]]:
+def read(filename: str, lazy: bool = False) -> Iterable[list[list[list_or_int]]]:
     path = os.path.join('src', MODULE, 'input', filename)
+    if lazy:
+        return iter_multi_input(path, transform=json.loads)
     return read_multi_input(path, transform=json.loads)
 
 
-def solve_part_one(lists: list[list[list[list_or_int]]]) -> int:
+def solve_part_one(lists: Iterable[list[list[list_or_int]]]) -> int:
     result = 0
     for i, (left, right) in enumerate(lists):
         if compare(left, right) == LT:
@@ -57,7 +60,7 @@ def solve_part_one(lists: list[list[list[list_or_int]]]) -> int:
     return result
 
 
-def solve_part_two(lists: list[list[list[list_or_int]]]) -> int:
+def solve_part_two(lists: Iterable[list[list[list_or_int]]]) -> int:
     lists = flatten(lists)
     divider1 = [[2]]
     divider2 = [[6]]
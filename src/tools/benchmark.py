@@ -0,0 +1,179 @@
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import statistics
+import tracemalloc
+from dataclasses import dataclass, field, asdict
+from types import ModuleType
+from typing import Any, Callable
+
+from src.utils.days import load_day, parse_days
+
+PHASES = ('read', 'part_one', 'part_two')
+
+Results = dict[str, dict[str, "Stats"]]
+
+
+@dataclass(frozen=True)
+class Stats:
+    min: float = field()
+    median: float = field()
+    p95: float = field()
+    peak_memory: int = field()
+
+    @classmethod
+    def from_samples(cls, samples: list[float], peak_memory: int) -> "Stats":
+        samples = sorted(samples)
+        # Nearest rank percentile, so it is always an actual sample
+        p95 = samples[math.ceil(0.95 * len(samples)) - 1]
+        return cls(samples[0], statistics.median(samples), p95, peak_memory)
+
+
+@dataclass(frozen=True)
+class Regression:
+    day: str = field()
+    phase: str = field()
+    baseline: float = field()
+    current: float = field()
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def measure(f: Callable[[], Any], warmup: int = 1, repeat: int = 5) -> Stats:
+    for _ in range(warmup):
+        f()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        samples.append(time.perf_counter() - start)
+
+    # Tracing slows everything down, so memory gets its own run
+    tracemalloc.start()
+    try:
+        f()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Stats.from_samples(samples, peak_memory)
+
+
+def benchmark_day(
+        module: ModuleType,
+        filename: str,
+        warmup: int = 1,
+        repeat: int = 5
+) -> dict[str, Stats]:
+    data = module.read(filename)
+    phases = {
+        'read': lambda: module.read(filename),
+        'part_one': lambda: module.solve_part_one(data),
+        'part_two': lambda: module.solve_part_two(data),
+    }
+    return {phase: measure(f, warmup, repeat) for phase, f in phases.items()}
+
+
+def run_benchmarks(
+        days: list[int],
+        filename: str,
+        warmup: int = 1,
+        repeat: int = 5
+) -> Results:
+    results = {}
+    for day in days:
+        module = load_day(day)
+        path = os.path.join('src', f'day{day:02}', 'input', filename)
+        if not os.path.exists(path):
+            print(f'Skipping day {day:02}: {path} not found', file=sys.stderr)
+            continue
+        results[f'day{day:02}'] = benchmark_day(module, filename, warmup, repeat)
+
+    return results
+
+
+def save_results(results: Results, filename: str):
+    data = {
+        day: {phase: asdict(stats) for phase, stats in phases.items()}
+        for day, phases in results.items()
+    }
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def load_results(filename: str) -> Results:
+    with open(filename) as f:
+        data = json.load(f)
+    return {
+        day: {phase: Stats(**stats) for phase, stats in phases.items()}
+        for day, phases in data.items()
+    }
+
+
+def compare(baseline: Results, current: Results, threshold: float = 0.1) -> list[Regression]:
+    regressions = []
+    for day, phases in current.items():
+        for phase, stats in phases.items():
+            if phase not in baseline.get(day, {}):
+                continue
+            reference = baseline[day][phase]
+            # Medians are the least noisy of the timings we keep
+            if stats.median > reference.median * (1 + threshold):
+                regressions.append(Regression(day, phase, reference.median, stats.median))
+
+    return regressions
+
+
+def format_results(results: Results) -> str:
+    lines = [
+        f'{"day":<6}{"phase":<10}{"min (ms)":>12}{"median (ms)":>14}'
+        f'{"p95 (ms)":>12}{"peak (KiB)":>12}'
+    ]
+    for day, phases in results.items():
+        for phase, stats in phases.items():
+            lines.append(
+                f'{day:<6}{phase:<10}{stats.min * 1e3:>12.3f}{stats.median * 1e3:>14.3f}'
+                f'{stats.p95 * 1e3:>12.3f}{stats.peak_memory / 1024:>12.1f}'
+            )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark parsing and solving of every day.')
+    parser.add_argument('days', nargs='*', help='days to run, e.g. 1 3 5-7 (default: all)')
+    parser.add_argument('--input', default='input.txt', help='input file name inside each day')
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='save results as JSON')
+    parser.add_argument('--baseline', help='JSON results to compare against')
+    parser.add_argument(
+        '--threshold', type=float, default=0.1, help='allowed median slowdown ratio'
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(parse_days(args.days), args.input, args.warmup, args.repeat)
+    print(format_results(results))
+
+    if args.output is not None:
+        save_results(results, args.output)
+
+    if args.baseline is not None:
+        regressions = compare(load_results(args.baseline), results, args.threshold)
+        for r in regressions:
+            print(
+                f'REGRESSION {r.day} {r.phase}: '
+                f'{r.baseline * 1e3:.3f} ms -> {r.current * 1e3:.3f} ms ({r.ratio:.2f}x)',
+                file=sys.stderr
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,338 @@
+import os
+import random
+import string
+import argparse
+from typing import Callable, Iterator
+
+from src.utils.days import find_days
+
+SIZE_SUFFIXES = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+Generator = Callable[[random.Random, int], Iterator[str]]
+
+
+def parse_size(size: str) -> int:
+    size = size.strip().upper().removesuffix('B')
+    if size and size[-1] in SIZE_SUFFIXES:
+        return int(float(size[:-1]) * SIZE_SUFFIXES[size[-1]])
+    return int(size)
+
+
+def calorie_groups(rng: random.Random, size: int) -> Iterator[str]:
+    written = 0
+    while written < size:
+        group = ''.join(f'{rng.randint(1000, 60000)}\n' for _ in range(rng.randint(1, 15)))
+        written += len(group) + 1
+        yield group + ('\n' if written < size else '')
+
+
+def strategy_guide(rng: random.Random, size: int) -> Iterator[str]:
+    for _ in range(max(1, size // 4)):
+        yield f'{rng.choice("ABC")} {rng.choice("XYZ")}\n'
+
+
+def rucksacks(rng: random.Random, size: int) -> Iterator[str]:
+    letters = string.ascii_letters
+    written = 0
+    while written < size:
+        badge, *others = rng.sample(letters, len(letters))
+        # Disjoint pools make the badge the only item shared by the whole group
+        for pool in (others[:17], others[17:34], others[34:]):
+            wrong, left_items, right_items = pool[0], pool[1:9], pool[9:]
+            half = rng.randint(4, 24)
+            left = [wrong, badge, *rng.choices(left_items, k=half - 2)]
+            right = [wrong, *rng.choices(right_items, k=half - 1)]
+            rng.shuffle(left)
+            rng.shuffle(right)
+            line = ''.join(left + right) + '\n'
+            written += len(line)
+            yield line
+
+
+def section_assignments(rng: random.Random, size: int) -> Iterator[str]:
+    written = 0
+    while written < size:
+        start1, end1 = sorted(rng.randint(1, 99) for _ in range(2))
+        start2, end2 = sorted(rng.randint(1, 99) for _ in range(2))
+        line = f'{start1}-{end1},{start2}-{end2}\n'
+        written += len(line)
+        yield line
+
+
+def crate_stacks(rng: random.Random, size: int) -> Iterator[str]:
+    # The drawing can only label stacks with one digit
+    n = 9
+    max_height = max(2, size // 10 // (4 * n))
+    heights = [rng.randint(max_height // 2 + 1, max_height) for _ in range(n)]
+
+    # Rows above the tallest stack would be blank lines, which end the drawing
+    for row in range(max(heights), 0, -1):
+        yield ' '.join(
+            f'[{rng.choice(string.ascii_uppercase)}]' if height >= row else '   '
+            for height in heights
+        ).rstrip() + '\n'
+    yield ' ' + '   '.join(str(i + 1) for i in range(n)) + '\n'
+    yield '\n'
+
+    written = max_height * 4 * n
+    while written < size:
+        # Never empty a stack so every stack keeps a top crate
+        from_stack = rng.choice([i for i, height in enumerate(heights) if height > 1])
+        to_stack = rng.choice([i for i in range(n) if i != from_stack])
+        count = rng.randint(1, heights[from_stack] - 1)
+        heights[from_stack] -= count
+        heights[to_stack] += count
+        line = f'move {count} from {from_stack + 1} to {to_stack + 1}\n'
+        written += len(line)
+        yield line
+
+
+def signal_buffer(rng: random.Random, size: int, chunk_size: int = 1 << 16) -> Iterator[str]:
+    # Three letters never form a marker, so both markers only show up at the very end
+    marker = string.ascii_lowercase[:14]
+    remaining = max(0, size - len(marker))
+    while remaining > 0:
+        chunk = min(chunk_size, remaining)
+        yield ''.join(rng.choices('abc', k=chunk))
+        remaining -= chunk
+    yield marker
+
+
+# Subdirectories by name and file sizes by name
+TreeNode = tuple[dict[str, 'TreeNode'], dict[str, int]]
+
+
+def iter_tree(node: TreeNode) -> Iterator[TreeNode]:
+    to_visit = [node]
+    while to_visit:
+        node = to_visit.pop()
+        yield node
+        to_visit.extend(node[0].values())
+
+
+def random_tree(rng: random.Random, size: int, max_depth: int) -> TreeNode:
+    root = ({}, {})
+    written = len('$ cd /\n')
+    # Filling the newest directory first gets deep trees
+    to_fill = [(root, 0)]
+    while to_fill and written < size:
+        (subdirs, files), depth = to_fill.pop()
+        written += len('$ ls\n')
+        # Going down keeps the tree growing, and part two needs something below the root
+        count = rng.randint(0 if to_fill else 1, 3) if depth < max_depth else 0
+        for i in range(count):
+            subdirs[f'd{i}'] = ({}, {})
+            to_fill.append((subdirs[f'd{i}'], depth + 1))
+            written += len(f'dir d{i}\n$ cd d{i}\n$ cd ..\n')
+        for _ in range(rng.randint(0, 4)):
+            name = ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8))) + '.txt'
+            if name not in files:
+                files[name] = rng.randint(1, 300_000)
+                written += len(f'{files[name]} {name}\n')
+    return root
+
+
+def scale_tree(
+        rng: random.Random,
+        root: TreeNode,
+        min_used: int = 40_000_000,
+        max_used: int = 70_000_000
+):
+    # Random sizes are only weights, the disk of part two has to fit them all
+    def weight(node: TreeNode) -> int:
+        return sum(sum(files.values()) for _, files in iter_tree(node))
+
+    biggest = max(root[0].values(), key=weight)
+    if not weight(root):
+        biggest[1]['a.txt'] = 1
+    total, part = weight(root), weight(biggest)
+
+    # Deleting the biggest directory below the root must free used - min_used
+    used = rng.randint(min_used, max_used)
+    if part < total:
+        used = min(used, min_used * total // (total - part))
+
+    for _, files in iter_tree(root):
+        for name in files:
+            files[name] = files[name] * used // total
+    # Rounding leftovers go to the biggest directory when it has files, which keeps it big enough
+    holders = [files for _, files in iter_tree(biggest) if files]
+    holders = holders or [files for _, files in iter_tree(root) if files]
+    holders[0][next(iter(holders[0]))] += used - weight(root)
+
+
+def terminal_output(rng: random.Random, size: int, max_depth: int = 200) -> Iterator[str]:
+    root = random_tree(rng, size, max_depth)
+    scale_tree(rng, root)
+
+    def listing(node: TreeNode) -> str:
+        subdirs, files = node
+        dirs = ''.join(f'dir {name}\n' for name in subdirs)
+        sizes = ''.join(f'{file_size} {name}\n' for name, file_size in files.items())
+        return '$ ls\n' + dirs + sizes
+
+    # Every directory is listed exactly once, on the way down
+    yield '$ cd /\n' + listing(root)
+    to_list = [iter(root[0].items())]
+    while to_list:
+        entry = next(to_list[-1], None)
+        if entry is None:
+            to_list.pop()
+            if to_list:
+                yield '$ cd ..\n'
+            continue
+        name, node = entry
+        yield f'$ cd {name}\n' + listing(node)
+        to_list.append(iter(node[0].items()))
+
+
+def tree_grid(rng: random.Random, size: int) -> Iterator[str]:
+    side = max(2, int(size ** 0.5))
+    for _ in range(side):
+        yield ''.join(rng.choices(string.digits, k=side)) + '\n'
+
+
+def rope_moves(rng: random.Random, size: int) -> Iterator[str]:
+    written = 0
+    while written < size:
+        line = f'{rng.choice("LURD")} {rng.randint(1, 20)}\n'
+        written += len(line)
+        yield line
+
+
+def cpu_program(rng: random.Random, size: int) -> Iterator[str]:
+    written = 0
+    cycles = 0
+    # Part one samples the signal up to cycle 220
+    while written < size or cycles < 240:
+        if rng.random() < 0.3:
+            line = 'noop\n'
+            cycles += 1
+        else:
+            line = f'addx {rng.randint(-20, 20)}\n'
+            cycles += 2
+        written += len(line)
+        yield line
+
+
+def monkey_specs(rng: random.Random, size: int) -> Iterator[str]:
+    primes = [2, 3, 5, 7, 11, 13, 17, 19, 23]
+    n = min(max(2, size // 1024), 64)
+    items_per_monkey = max(1, (size - 160 * n) // (4 * n))
+
+    for i in range(n):
+        items = ', '.join(str(rng.randint(50, 99)) for _ in range(items_per_monkey))
+        # Squaring makes part one numbers explode once items go around a few times
+        operation = f'old {rng.choice("+*")} {rng.randint(1, 9)}'
+        others = [j for j in range(n) if j != i]
+        true_id, false_id = rng.sample(others, 2) if n > 2 else (1 - i, 1 - i)
+        yield (
+            f'Monkey {i}:\n'
+            f'  Starting items: {items}\n'
+            f'  Operation: new = {operation}\n'
+            f'  Test: divisible by {primes[i % len(primes)]}\n'
+            f'    If true: throw to monkey {true_id}\n'
+            f'    If false: throw to monkey {false_id}\n'
+        ) + ('\n' if i < n - 1 else '')
+
+
+def height_map(rng: random.Random, size: int) -> Iterator[str]:
+    # Large enough for the corridor to go from a to z one step at a time
+    side = max(14, int(size ** 0.5))
+    rows, cols = side, side
+    corridor_length = rows + cols - 2
+
+    def corridor_height(p: int) -> int:
+        return p * 25 // corridor_length
+
+    # The first row and last column form a climbable path from S to E,
+    # the rest is noise around a slope
+    for i in range(rows):
+        line = []
+        for j in range(cols):
+            if i == 0 and j == 0:
+                line.append('S')
+            elif i == rows - 1 and j == cols - 1:
+                line.append('E')
+            elif i == 0 or j == cols - 1:
+                line.append(chr(ord('a') + corridor_height(i + j)))
+            else:
+                height = corridor_height(i + j) + rng.randint(-3, 1)
+                line.append(chr(ord('a') + min(25, max(0, height))))
+        yield ''.join(line) + '\n'
+
+
+def packet_pairs(rng: random.Random, size: int, max_depth: int = 30) -> Iterator[str]:
+    def packet(depth: int) -> list:
+        elements = []
+        for _ in range(rng.randint(0, 4)):
+            if depth < max_depth and rng.random() < 0.4:
+                elements.append(packet(depth + 1))
+            else:
+                elements.append(rng.randint(0, 10))
+        return elements
+
+    def dumps(p: list) -> str:
+        return str(p).replace(' ', '')
+
+    written = 0
+    while written < size:
+        left = packet(0)
+        # Sharing the whole left side forces a full comparison
+        right = [*left, rng.randint(0, 10)] if rng.random() < 0.5 else packet(0)
+        chunk = f'{dumps(left)}\n{dumps(right)}\n'
+        written += len(chunk) + 1
+        yield chunk + ('\n' if written < size else '')
+
+
+GENERATORS: dict[int, Generator] = {
+    1: calorie_groups,
+    2: strategy_guide,
+    3: rucksacks,
+    4: section_assignments,
+    5: crate_stacks,
+    6: signal_buffer,
+    7: terminal_output,
+    8: tree_grid,
+    9: rope_moves,
+    10: cpu_program,
+    11: monkey_specs,
+    12: height_map,
+    13: packet_pairs,
+}
+
+
+def generate(day: int, size: int, seed: int = 0) -> Iterator[str]:
+    if day not in GENERATORS:
+        raise ValueError(f'There is no generator for day {day}')
+    return GENERATORS[day](random.Random(seed), size)
+
+
+def write_input(day: int, filename: str, size: int, seed: int = 0):
+    with open(filename, 'w') as f:
+        f.writelines(generate(day, size, seed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate large seeded puzzle inputs.')
+    parser.add_argument('day', type=int)
+    parser.add_argument('--size', default='1M', help='approximate size, e.g. 512K, 10M or 2G')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--output', help='default: generated.txt inside the input folder of the day'
+    )
+    args = parser.parse_args()
+
+    if args.day not in find_days():
+        parser.error(f'Day {args.day} is not solved yet')
+
+    output = args.output
+    if output is None:
+        output = os.path.join('src', f'day{args.day:02}', 'input', 'generated.txt')
+
+    write_input(args.day, output, parse_size(args.size), args.seed)
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
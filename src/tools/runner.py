@@ -0,0 +1,170 @@
+import os
+import sys
+import time
+import argparse
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+
+from src.utils.days import load_day, parse_days
+from src.utils.cache import DiskCache, cached_read, input_digest, solve_key
+from src.utils import profiling
+
+PARTS = {1: 'solve_part_one', 2: 'solve_part_two'}
+
+
+@dataclass(frozen=True)
+class Task:
+    day: int = field()
+    filename: str = field()
+    parts: tuple[int, ...] = field(default=(1, 2))
+    cache_dir: str | None = field(default=None)
+    cache_size: int = field(default=256 * 1024 ** 2)
+    memo_dir: str | None = field(default=None)
+    memo_size: int = field(default=64 * 1024 ** 2)
+
+
+@dataclass(frozen=True)
+class PartResult:
+    part: int = field()
+    answer: Any = field()
+    seconds: float = field()
+    memoized: bool = field(default=False)
+
+
+@dataclass(frozen=True)
+class TaskResult:
+    task: Task = field()
+    read_seconds: float = field()
+    parts: list[PartResult] = field()
+
+
+def input_path(day: int, filename: str) -> str:
+    return os.path.join('src', f'day{day:02}', 'input', filename)
+
+
+def run_task(task: Task) -> TaskResult:
+    module = load_day(task.day)
+    memo = DiskCache(task.memo_dir, task.memo_size) if task.memo_dir is not None else None
+
+    parts = {}
+    if memo is not None:
+        digest = input_digest(module, task.filename, memo)
+        for part in task.parts:
+            start = time.perf_counter()
+            try:
+                answer = memo.get(solve_key(module, part, digest))
+            except KeyError:
+                continue
+            parts[part] = PartResult(part, answer, time.perf_counter() - start, memoized=True)
+
+    # Nothing needs to be parsed when every answer is already known
+    read_seconds = 0.0
+    missing = [part for part in task.parts if part not in parts]
+    if missing:
+        start = time.perf_counter()
+        if task.cache_dir is not None:
+            data = cached_read(module, task.filename, DiskCache(task.cache_dir, task.cache_size))
+        else:
+            data = module.read(task.filename)
+        read_seconds = time.perf_counter() - start
+
+    for part in missing:
+        start = time.perf_counter()
+        answer = getattr(module, PARTS[part])(data)
+        parts[part] = PartResult(part, answer, time.perf_counter() - start)
+        if memo is not None:
+            memo.put(solve_key(module, part, digest), answer)
+
+    return TaskResult(task, read_seconds, [parts[part] for part in task.parts])
+
+
+def run_tasks(tasks: Iterable[Task], jobs: int = 1) -> Iterator[TaskResult]:
+    if jobs == 1:
+        yield from map(run_task, tasks)
+        return
+
+    # Pulling in multiprocessing costs more than solving most days
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(jobs) as executor:
+        yield from executor.map(run_task, tasks)
+
+
+def format_result(result: TaskResult) -> str:
+    task = result.task
+    lines = [f'day {task.day:02} [{task.filename}] read: {result.read_seconds * 1e3:.3f} ms']
+    for part in result.parts:
+        answer = str(part.answer)
+        # Drawings go below their header
+        separator = '\n' if '\n' in answer else ' '
+        memoized = ', memoized' if part.memoized else ''
+        header = (
+            f'day {task.day:02} [{task.filename}] part {part.part} '
+            f'({part.seconds * 1e3:.3f} ms{memoized}):'
+        )
+        lines.append(header + separator + answer)
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='aoc', description='Solve many days in a single process.')
+    parser.add_argument('days', nargs='*', help='days to run, e.g. 1 3 5-7 (default: all)')
+    parser.add_argument(
+        '--parts', nargs='+', type=int, choices=sorted(PARTS), default=sorted(PARTS)
+    )
+    parser.add_argument(
+        '--input', nargs='+', default=['input.txt'], help='input file names inside each day'
+    )
+    parser.add_argument('--jobs', type=int, default=1, help='spread days over a pool of processes')
+    parser.add_argument('--cache', help='directory where parsed inputs are cached')
+    parser.add_argument('--cache-size', type=int, default=256, help='maximum cache size in MiB')
+    parser.add_argument('--memo', help='directory where answers are memoized')
+    parser.add_argument('--memo-size', type=int, default=64, help='maximum memo size in MiB')
+    parser.add_argument(
+        '--profile', help='collect solver phases into a pstats file plus a .folded one'
+    )
+    parser.add_argument(
+        '--profile-memory', action='store_true', help='also track allocations per phase'
+    )
+    args = parser.parse_args()
+
+    if args.profile is not None and args.jobs > 1:
+        parser.error('--profile only works in a single process')
+    if args.profile is not None:
+        profiling.enable(track_memory=args.profile_memory)
+
+    tasks = []
+    for day in parse_days(args.days):
+        for filename in args.input:
+            if not os.path.exists(input_path(day, filename)):
+                path = input_path(day, filename)
+                print(f'Skipping day {day:02}: {path} not found', file=sys.stderr)
+                continue
+            tasks.append(Task(
+                day,
+                filename,
+                tuple(args.parts),
+                args.cache,
+                args.cache_size * 1024 ** 2,
+                args.memo,
+                args.memo_size * 1024 ** 2
+            ))
+
+    hits = misses = 0
+    start = time.perf_counter()
+    for result in run_tasks(tasks, args.jobs):
+        print(format_result(result))
+        hits += sum(part.memoized for part in result.parts)
+        misses += sum(not part.memoized for part in result.parts)
+    print(f'{len(tasks)} tasks in {(time.perf_counter() - start) * 1e3:.3f} ms')
+    if args.memo is not None:
+        print(f'memo: {hits} hits, {misses} misses')
+
+    if args.profile is not None:
+        profiling.disable()
+        print(profiling.report())
+        profiling.dump(args.profile)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+import os
+import glob
+import pickle
+import hashlib
+import tempfile
+import functools
+from types import ModuleType
+from typing import Any
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_MAX_SIZE = 256 * 1024 ** 2
+
+
+def file_digest(filename: str, cache: "DiskCache" = None, chunk_size: int = 1 << 20) -> str:
+    # Hashing huge inputs dominates a cache hit, so reuse digests of untouched files
+    stat = os.stat(filename)
+    signature = stat.st_size, stat.st_mtime_ns, stat.st_ino
+    key = 'digest-' + hashlib.sha256(os.path.realpath(filename).encode()).hexdigest()
+    if cache is not None:
+        try:
+            cached_signature, cached_digest = cache.get(key)
+            if cached_signature == signature:
+                return cached_digest
+        except KeyError:
+            pass
+
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+
+    if cache is not None:
+        cache.put(key, (signature, digest.hexdigest()))
+    return digest.hexdigest()
+
+
+@functools.cache
+def code_version(module: ModuleType) -> str:
+    # Any change to the day or to the shared helpers invalidates what it produced
+    digest = hashlib.sha256()
+    for filename in [module.__file__, *sorted(glob.glob(os.path.join(UTILS_DIR, '*.py')))]:
+        with open(filename, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class DiskCache:
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE):
+        self._directory = directory
+        self._max_size = max_size
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else 0.0
+
+    def get(self, key: str) -> Any:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+            # Modification time doubles as last access for the LRU policy
+            os.utime(path)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError, AttributeError):
+            # Evicted meanwhile, truncated, or pickled from classes that are gone
+            self._misses += 1
+            self._remove(path)
+            raise KeyError(key) from None
+
+        self._hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> bool:
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            return False
+
+        if len(data) > self._max_size:
+            return False
+
+        # Write aside and rename so other processes never see half an entry
+        fd, tmp = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, self._path(key))
+
+        self._evict()
+        return True
+
+    def clear(self):
+        for entry in self._entries():
+            self._remove(entry.path)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, f'{key}.pickle')
+
+    def _entries(self) -> list[os.DirEntry]:
+        with os.scandir(self._directory) as it:
+            return [entry for entry in it if entry.name.endswith('.pickle')]
+
+    def _evict(self):
+        entries = []
+        for entry in self._entries():
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry.stat().st_size, entry.path))
+            except FileNotFoundError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self._max_size:
+                break
+            self._remove(path)
+            self._evictions += 1
+            total -= size
+
+    @staticmethod
+    def _remove(path: str):
+        # Another process may have evicted it already
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def input_digest(module: ModuleType, filename: str, cache: DiskCache = None) -> str:
+    return file_digest(os.path.join('src', module.MODULE, 'input', filename), cache)
+
+
+def read_key(module: ModuleType, digest: str) -> str:
+    return f'{module.MODULE}-read-{digest}-{code_version(module)}'
+
+
+def solve_key(module: ModuleType, part: int, digest: str) -> str:
+    return f'{module.MODULE}-part{part}-{digest}-{code_version(module)}'
+
+
+def cached_read(module: ModuleType, filename: str, cache: DiskCache) -> Any:
+    key = read_key(module, input_digest(module, filename, cache))
+    try:
+        return cache.get(key)
+    except KeyError:
+        pass
+
+    data = module.read(filename)
+    cache.put(key, data)
+    return data
+
@@ -0,0 +1,40 @@
+import os
+import re
+import importlib
+from types import ModuleType
+
+DAY_RE = re.compile(r'^day(\d{2})$')
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def find_days() -> dict[int, str]:
+    days = {}
+    for entry in sorted(os.listdir(SRC_DIR)):
+        match = DAY_RE.match(entry)
+        if match is None:
+            continue
+
+        for filename in sorted(os.listdir(os.path.join(SRC_DIR, entry))):
+            if filename.endswith('.py') and filename != '__init__.py':
+                days[int(match.group(1))] = f'src.{entry}.{filename[:-3]}'
+
+    return days
+
+
+def load_day(day: int) -> ModuleType:
+    days = find_days()
+    if day not in days:
+        raise ValueError(f'Day {day} is not solved yet')
+    return importlib.import_module(days[day])
+
+
+def parse_days(specs: list[str]) -> list[int]:
+    # Single days or inclusive ranges like 5-7, nothing means every day
+    if not specs:
+        return sorted(find_days())
+
+    days = set()
+    for spec in specs:
+        first, _, last = spec.partition('-')
+        days.update(range(int(first), int(last or first) + 1))
+    return sorted(days)
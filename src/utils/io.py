@@ -1,4 +1,13 @@
-from typing import Callable, TypeVar
+from __future__ import annotations
+
+import os
+import mmap
+from array import array
+from typing import Callable, Iterator, Sequence, TypeVar
+
+from src.utils.lazy import lazy_import
+
+np = lazy_import('numpy')
 
 
 T = TypeVar('T')
@@ -9,20 +18,41 @@ def read_all(filename: str) -> str:
         return f.read()
 
 
-def read_lines(filename: str) -> list[str]:
+def iter_lines(filename: str) -> Iterator[str]:
     with open(filename) as f:
-        return [line.rstrip('\n') for line in f]
+        for line in f:
+            yield line.rstrip('\n')
 
 
-def read_input(filename: str, transform: Callable[[str], T] = None) -> list[T]:
-    with open(filename) as f:
-        elements = []
-        for line in f:
-            line = line.rstrip('\n')
+def iter_input(filename: str, transform: Callable[[str], T] = None) -> Iterator[T]:
+    for line in iter_lines(filename):
+        yield transform(line) if transform is not None else line
+
+
+def iter_multi_input(
+        filename: str,
+        end: str = '',
+        transform: Callable[[str], T] = None
+) -> Iterator[list[T]]:
+    elements = []
+    for line in iter_lines(filename):
+        if line == end:
+            yield elements
+            elements = []
+        else:
             element = transform(line) if transform is not None else line
             elements.append(element)
 
-    return elements
+    if elements:
+        yield elements
+
+
+def read_lines(filename: str) -> list[str]:
+    return list(iter_lines(filename))
+
+
+def read_input(filename: str, transform: Callable[[str], T] = None) -> list[T]:
+    return list(iter_input(filename, transform))
 
 
 def read_multi_input(
@@ -30,19 +60,228 @@ def read_multi_input(
         end: str = '',
         transform: Callable[[str], T] = None
 ) -> list[list[T]]:
-    with open(filename) as f:
-        all_elements = []
-        elements = []
-        for line in f:
-            line = line.rstrip('\n')
-            if line == end:
-                all_elements.append(elements)
-                elements = []
+    return list(iter_multi_input(filename, end, transform))
+
+
+def parse_int_lines(
+        data: np.ndarray[np.uint8]
+) -> tuple[np.ndarray[np.int64], np.ndarray[np.bool_]]:
+    newlines = np.flatnonzero(data == ord('\n'))
+    if len(data) > 0 and data[-1] != ord('\n'):
+        newlines = np.append(newlines, len(data))
+
+    starts = np.concatenate(([0], newlines[:-1] + 1))
+    lengths = newlines - starts
+    filled = lengths > 0
+    starts, lengths = starts[filled], lengths[filled]
+
+    # Horner's rule, one digit position at a time for every line at once
+    values = np.zeros(len(starts), dtype=np.int64)
+    for k in range(int(lengths.max(initial=0))):
+        has_digit = lengths > k
+        digits = data[np.where(has_digit, starts + k, 0)].astype(np.int64) - ord('0')
+        if np.any(has_digit & ((digits < 0) | (digits > 9))):
+            raise ValueError('Only unsigned integers and blank lines are allowed')
+        values = np.where(has_digit, values * 10 + digits, values)
+
+    return values, filled
+
+
+def iter_line_chunks(filename: str, chunk_size: int = 1 << 22, start: int = 0) -> Iterator[bytes]:
+    # Chunks of about chunk_size bytes that never split a line
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        rest = b''
+        while chunk := f.read(chunk_size):
+            chunk = rest + chunk
+            cut = chunk.rfind(b'\n') + 1
+            if cut:
+                yield chunk[:cut]
+            rest = chunk[cut:]
+
+        if rest:
+            yield rest
+
+
+def read_int_groups(
+        filename: str,
+        chunk_size: int = 1 << 22
+) -> tuple[np.ndarray[np.int64], np.ndarray[np.intp]]:
+    # Parsing needs scratch memory proportional to the chunk, so never go over the whole file
+    values = [np.zeros(0, dtype=np.int64)]
+    filled = [np.zeros(0, dtype=np.bool_)]
+    for chunk in iter_line_chunks(filename, chunk_size):
+        chunk_values, chunk_filled = parse_int_lines(np.frombuffer(chunk, dtype=np.uint8))
+        values.append(chunk_values)
+        filled.append(chunk_filled)
+
+    values = np.concatenate(values)
+    filled = np.concatenate(filled)
+
+    # A group starts at every non-blank line that follows a blank one
+    follows_blank = np.concatenate(([True], ~filled[:-1]))
+    value_indices = np.cumsum(filled) - filled
+    offsets = value_indices[filled & follows_blank]
+    return values, offsets
+
+
+# Everything but digits becomes a line break, leaving one integer per non-blank line
+NON_DIGITS_TO_NEWLINES = bytes(c if ord('0') <= c <= ord('9') else ord('\n') for c in range(256))
+
+
+def parse_ints(data: bytes) -> np.ndarray[np.int64]:
+    lines = np.frombuffer(data.translate(NON_DIGITS_TO_NEWLINES), dtype=np.uint8)
+    values, _ = parse_int_lines(lines)
+    return values
+
+
+def parse_int_columns(data: bytes, separators: bytes) -> np.ndarray[np.int64]:
+    # Every line holds one integer per column, each separator ending a column
+    if data and not data.endswith(b'\n'):
+        data += b'\n'
+    columns = len(separators) + 1
+    fields = data.translate(bytes.maketrans(separators, b'\n' * len(separators)))
+    fields = np.frombuffer(fields, dtype=np.uint8)
+
+    # Separators must show up in order, with the end of the line after the last one
+    expected = np.frombuffer(separators + b'\n', dtype=np.uint8)
+    layout = np.frombuffer(data, dtype=np.uint8)[fields == ord('\n')]
+    if len(layout) % columns != 0 or np.any(layout.reshape(-1, columns) != expected):
+        raise ValueError(f'Every line must have {columns} integers separated by {separators!r}')
+
+    values, filled = parse_int_lines(fields)
+    if not np.all(filled):
+        raise ValueError('Fields cannot be empty')
+    return values.reshape(-1, columns)
+
+
+def read_int_columns(
+        filename: str,
+        separators: bytes,
+        chunk_size: int = 1 << 22
+) -> np.ndarray[np.int64]:
+    columns = [np.zeros((0, len(separators) + 1), dtype=np.int64)]
+    for chunk in iter_line_chunks(filename, chunk_size):
+        columns.append(parse_int_columns(chunk, separators))
+    return np.concatenate(columns)
+
+
+def find_shards(
+        filename: str,
+        shards: int,
+        separator: bytes = b'\n\n',
+        chunk_size: int = 1 << 16
+) -> list[tuple[int, int]]:
+    # Byte ranges that only start right after a separator, so no record is split
+    size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, 'rb') as f:
+        for k in range(1, shards):
+            position = max(k * size // shards, boundaries[-1])
+            f.seek(position)
+            # Keep the tail of the last chunk in case the separator spans two of them
+            window = b''
+            while chunk := f.read(chunk_size):
+                window += chunk
+                index = window.find(separator)
+                if index != -1:
+                    boundaries.append(position + index + len(separator))
+                    break
+                # A one byte separator leaves nothing to keep
+                dropped = max(len(window) - len(separator) + 1, 0)
+                position += dropped
+                window = window[dropped:]
             else:
-                element = transform(line) if transform is not None else line
-                elements.append(element)
+                break
 
-    if elements:
-        all_elements.append(elements)
+    boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+
+def iter_range_lines(filename: str, start: int, end: int) -> Iterator[str]:
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line.decode().rstrip('\n')
+
+
+class MappedFile(Sequence[memoryview]):
+
+    def __init__(self, filename: str):
+        with open(filename, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # Empty files cannot be mapped
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+        self._buffer = memoryview(self._mmap if self._mmap is not None else b'')
+        self._newlines = self._index_newlines()
+
+    @property
+    def buffer(self) -> memoryview:
+        return self._buffer
+
+    @property
+    def newlines(self) -> array:
+        return self._newlines
+
+    def line_span(self, index: int) -> tuple[int, int]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        start = self._newlines[index - 1] + 1 if index > 0 else 0
+        end = self._newlines[index] if index < len(self._newlines) else len(self._buffer)
+        return start, end
+
+    def close(self):
+        self._buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self) -> "MappedFile":
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.close()
+            return
+        # Frames of the traceback may still hold views of the buffer, which would then
+        # hide the real error behind a BufferError. The mapping goes away with them instead.
+        try:
+            self.close()
+        except BufferError:
+            pass
+
+    def __len__(self) -> int:
+        # A last line without trailing newline still counts
+        if self._newlines and self._newlines[-1] == len(self._buffer) - 1:
+            return len(self._newlines)
+        return len(self._newlines) + (len(self._buffer) > 0)
+
+    def __getitem__(self, index: int) -> memoryview:
+        start, end = self.line_span(index)
+        return self._buffer[start:end]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        start = 0
+        for end in self._newlines:
+            yield self._buffer[start:end]
+            start = end + 1
+        if start < len(self._buffer):
+            yield self._buffer[start:]
+
+    def _index_newlines(self) -> array:
+        newlines = array('q')
+        if self._mmap is None:
+            return newlines
 
-    return all_elements
+        # One vectorized pass, a find call per line is slower than reading the text
+        data = np.frombuffer(self._mmap, dtype=np.uint8)
+        newlines.frombytes(np.flatnonzero(data == ord('\n')).astype(np.int64).tobytes())
+        return newlines
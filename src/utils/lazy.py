@@ -0,0 +1,20 @@
+import sys
+import importlib.util
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    # Module is only executed on first attribute access
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
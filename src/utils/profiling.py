@@ -0,0 +1,171 @@
+import time
+import functools
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+Path = tuple[str, ...]
+
+_enabled = False
+_track_memory = False
+# Every open phase: name, start time, traced memory at start and time spent in children
+_stack: list[list] = []
+_stats: dict[Path, "PhaseStats"] = {}
+
+
+@dataclass
+class PhaseStats:
+    calls: int = field(default=0)
+    seconds: float = field(default=0.0)
+    self_seconds: float = field(default=0.0)
+    allocated: int = field(default=0)
+
+
+def enable(track_memory: bool = False):
+    global _enabled, _track_memory
+    _enabled = True
+    _track_memory = track_memory
+    if track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable():
+    global _enabled
+    _enabled = False
+    if _track_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    _stack.clear()
+    _stats.clear()
+
+
+class Phase:
+
+    def __init__(self, name: str):
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def __enter__(self) -> "Phase":
+        if _enabled:
+            memory = tracemalloc.get_traced_memory()[0] if _track_memory else 0
+            _stack.append([self._name, time.perf_counter(), memory, 0.0])
+        return self
+
+    def __exit__(self, *args):
+        # The phase may have been entered before profiling was enabled
+        if not _stack or _stack[-1][0] != self._name:
+            return
+
+        name, start, memory, children = _stack.pop()
+        elapsed = time.perf_counter() - start
+        path = tuple(entry[0] for entry in _stack) + (name,)
+
+        stats = _stats.setdefault(path, PhaseStats())
+        stats.calls += 1
+        stats.seconds += elapsed
+        stats.self_seconds += elapsed - children
+        if _track_memory:
+            stats.allocated += tracemalloc.get_traced_memory()[0] - memory
+
+        if _stack:
+            _stack[-1][3] += elapsed
+
+    def __call__(self, f: F) -> F:
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return f(*args, **kwargs)
+            with self:
+                return f(*args, **kwargs)
+
+        return wrapper
+
+    def bind(self, f: F) -> F:
+        # For hot paths: only wraps while profiling, so a disabled phase costs nothing per call
+        return self(f) if _enabled else f
+
+
+def phase(name: str) -> Phase:
+    return Phase(name)
+
+
+def stack_stats() -> dict[Path, PhaseStats]:
+    return dict(_stats)
+
+
+def phase_stats() -> dict[str, PhaseStats]:
+    per_phase = {}
+    for path, stats in _stats.items():
+        total = per_phase.setdefault(path[-1], PhaseStats())
+        total.calls += stats.calls
+        total.self_seconds += stats.self_seconds
+        total.allocated += stats.allocated
+        # Recursive phases are already counted by their outermost call
+        if path[-1] not in path[:-1]:
+            total.seconds += stats.seconds
+    return per_phase
+
+
+def collapsed_stacks() -> str:
+    # One line per stack with its self time in microseconds, as flamegraph.pl expects
+    return '\n'.join(
+        f'{";".join(path)} {round(stats.self_seconds * 1e6)}'
+        for path, stats in sorted(_stats.items())
+    )
+
+
+def to_pstats() -> "pstats.Stats":
+    import pstats
+
+    def key(name: str) -> tuple[str, int, str]:
+        return 'phase', 0, name
+
+    raw = {}
+    for name, stats in phase_stats().items():
+        raw[key(name)] = (stats.calls, stats.calls, stats.self_seconds, stats.seconds, {})
+
+    for path, stats in _stats.items():
+        if len(path) < 2:
+            continue
+        callers = raw[key(path[-1])][4]
+        caller = key(path[-2])
+        cc, nc, tt, ct = callers.get(caller, (0, 0, 0.0, 0.0))
+        callers[caller] = (
+            cc + stats.calls, nc + stats.calls, tt + stats.self_seconds, ct + stats.seconds
+        )
+
+    class Profile:
+        def __init__(self):
+            self.stats = {}
+
+        def create_stats(self):
+            self.stats = raw
+
+    return pstats.Stats(Profile())
+
+
+def dump(filename: str):
+    to_pstats().dump_stats(filename)
+    with open(filename + '.folded', 'w') as f:
+        f.write(collapsed_stacks() + '\n')
+
+
+def report() -> str:
+    lines = [f'{"phase":<32}{"calls":>12}{"total (ms)":>14}{"self (ms)":>14}{"alloc (KiB)":>14}']
+    for name, stats in sorted(phase_stats().items(), key=lambda item: -item[1].seconds):
+        lines.append(
+            f'{name:<32}{stats.calls:>12}{stats.seconds * 1e3:>14.3f}'
+            f'{stats.self_seconds * 1e3:>14.3f}{stats.allocated / 1024:>14.1f}'
+        )
+    return '\n'.join(lines)
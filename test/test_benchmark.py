@@ -0,0 +1,15 @@
+from src.day01 import calorie_counting
+from src.tools.benchmark import PHASES, Stats, benchmark_day, compare
+
+
+def test_benchmark_day():
+    results = benchmark_day(calorie_counting, 'test-input.txt', warmup=0, repeat=3)
+    assert tuple(results) == PHASES
+    assert all(s.min <= s.median <= s.p95 for s in results.values())
+
+
+def test_compare_flags_regressions():
+    baseline = {'day01': {'read': Stats(1.0, 1.0, 1.0, 0), 'part_one': Stats(1.0, 1.0, 1.0, 0)}}
+    current = {'day01': {'read': Stats(1.0, 1.05, 1.1, 0), 'part_one': Stats(1.0, 2.0, 2.0, 0)}}
+    regressions = compare(baseline, current, threshold=0.1)
+    assert [(r.day, r.phase) for r in regressions] == [('day01', 'part_one')]
@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from src.day11 import monkey_in_the_middle
+from src.utils.cache import DiskCache, cached_read
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(str(tmp_path), max_size=2500)
+    cache.put('a', b'a' * 1000)
+    cache.put('b', b'b' * 1000)
+    # Make sure access times differ on coarse clocks
+    os.utime(os.path.join(tmp_path, 'a.pickle'), ns=(0, 0))
+    os.utime(os.path.join(tmp_path, 'b.pickle'), ns=(1, 1))
+    cache.get('a')
+    cache.put('c', b'c' * 1000)
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+
+
+def test_cached_read(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    data = cached_read(monkey_in_the_middle, 'test-input.txt', cache)
+    assert cache.hits == 0
+    cached = cached_read(monkey_in_the_middle, 'test-input.txt', cache)
+    # Both the input digest and the parsed input come from the cache
+    assert cache.hits == 2
+    expected = monkey_in_the_middle.solve_part_one(data)
+    assert monkey_in_the_middle.solve_part_one(cached) == expected == 10605
+
+
+def test_disk_cache_metrics(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    with pytest.raises(KeyError):
+        cache.get('b')
+    assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+
+def test_disk_cache_drops_broken_entries(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.put('a', list(range(100)))
+    path = os.path.join(tmp_path, 'a.pickle')
+    with open(path, 'rb') as f:
+        data = f.read()
+    for broken in (data[:len(data) // 2], b'not a pickle'):
+        with open(path, 'wb') as f:
+            f.write(broken)
+        with pytest.raises(KeyError):
+            cache.get('a')
+        assert 'a' not in cache
+    assert cache.misses == 2
@@ -1,4 +1,9 @@
-from src.day01.calorie_counting import read, solve_part_one, solve_part_two
+import pytest
+
+from src.day01.calorie_counting import (
+    get_top_n_max_calories, get_top_n_max_calories_sharded, read, read_calories_per_elf,
+    solve_part_one, solve_part_two, TopCalories
+)
 
 
 def test_calorie_counter():
@@ -11,3 +16,49 @@ def test_top_n_calorie_counter():
     data = read('test-input.txt')
     result = solve_part_two(data)
     assert result == 45000
+
+
+def test_lazy_calorie_counter():
+    data = read('test-input.txt', lazy=True)
+    result = solve_part_two(data)
+    assert result == 45000
+
+
+def test_bulk_calorie_counter():
+    data = read('test-input.txt', bulk=True)
+    assert solve_part_one(data) == 24000
+    assert solve_part_two(data) == 45000
+
+
+def test_streaming_top_calories():
+    top = TopCalories(n=3)
+    top.update(read_calories_per_elf('test-input.txt'))
+    assert top.values == [24000, 11000, 10000]
+    assert top.total == 45000
+
+
+def test_merge_top_calories():
+    first, second = TopCalories(n=2), TopCalories(n=2)
+    first.update([1, 5, 3])
+    second.update([4, 2])
+    first.merge(second)
+    assert first.values == [5, 4]
+
+
+def test_sharded_calorie_counter():
+    expected = solve_part_two(read('input.txt'))
+    for shards in (1, 2, 7, 1000):
+        assert get_top_n_max_calories_sharded('input.txt', n=3, shards=shards, jobs=1) == expected
+    assert get_top_n_max_calories_sharded('input.txt', n=3, shards=4, jobs=2) == expected
+
+
+def test_tuple_of_groups_is_not_bulk():
+    assert solve_part_one(([1, 2], [0, 1])) == 3
+
+
+def test_top_zero_elves():
+    for data in (read('test-input.txt'), read('test-input.txt', bulk=True)):
+        assert get_top_n_max_calories(data, n=0) == 0
+    assert TopCalories(0).total == 0
+    with pytest.raises(ValueError):
+        TopCalories(-1)
@@ -1,4 +1,6 @@
-from src.day02.rock_paper_scissors import read, solve_part_one, solve_part_two
+import pytest
+
+from src.day02.rock_paper_scissors import read, solve_part_one, solve_part_two, StrategyHistogram
 
 
 def test_rock_paper_scissors_simulator():
@@ -11,3 +13,48 @@ def test_rock_paper_scissors_correct_simulator():
     data = read('test-input.txt')
     result = solve_part_two(data)
     assert result == 12
+
+
+def test_lazy_rock_paper_scissors_simulator():
+    data = read('test-input.txt', lazy=True)
+    result = solve_part_one(data)
+    assert result == 15
+
+
+def test_mapped_rock_paper_scissors_simulator():
+    with read('test-input.txt', mapped=True) as data:
+        assert solve_part_one(data) == 15
+        assert solve_part_two(data) == 12
+
+
+def test_invalid_strategy_guide():
+    with pytest.raises(ValueError):
+        solve_part_one(b'A Y\nD X\n')
+    with pytest.raises(ValueError):
+        solve_part_two([('A', 'Y'), ('B', 'W')])
+
+
+def test_counted_rock_paper_scissors_simulator():
+    data = read('test-input.txt', counted=True)
+    assert data.rounds == 3
+    assert solve_part_one(data) == 15
+    assert solve_part_two(data) == 12
+
+
+def test_incremental_strategy_histogram():
+    histogram = StrategyHistogram()
+    histogram.update(read('test-input.txt', lazy=True))
+    assert solve_part_one(histogram) == 15
+
+    histogram.add('A', 'Y')
+    histogram.update(b'C Z\n')
+    assert histogram.counts == ((0, 2, 0), (1, 0, 0), (0, 0, 2))
+    assert solve_part_one(histogram) == 15 + 8 + 6
+
+
+def test_counted_invalid_strategy_guide(tmp_path):
+    for i, guide in enumerate((b'A Y\nD X\n', b'A Y\r\nB X\r\n')):
+        path = tmp_path / f'guide-{i}.txt'
+        path.write_bytes(guide)
+        with pytest.raises(ValueError):
+            read(str(path), counted=True)
@@ -1,4 +1,8 @@
-from src.day03.rucksack_reorganization import read, solve_part_one, solve_part_two
+import pytest
+
+from src.day03.rucksack_reorganization import (
+    get_items, read, solve_part_one, solve_part_two, sum_group_badges
+)
 
 
 def test_rucksack_reorganization():
@@ -11,3 +15,40 @@ def test_rucksack_reorganization_badges():
     data = read('test-input.txt')
     result = solve_part_two(data)
     assert result == 70
+
+
+def test_mapped_group_badges():
+    with read('test-input.txt', mapped=True) as data:
+        result = solve_part_two(data)
+    assert result == 70
+
+
+def test_bulk_rucksack_reorganization():
+    data = read('test-input.txt', bulk=True)
+    assert solve_part_one(data) == 157
+    assert solve_part_two(data) == 70
+
+
+def test_item_masks():
+    assert get_items('aAz') == 1 | 1 << 26 | 1 << 25
+    with pytest.raises(ValueError):
+        get_items('a1')
+
+
+def test_lazy_group_badges():
+    data = read('test-input.txt', lazy=True)
+    result = solve_part_two(data)
+    assert result == 70
+
+
+def test_group_badges_of_any_size():
+    assert sum_group_badges(['ab', 'ba', 'ca', 'ad'], n=4) == 1
+    assert sum_group_badges(['ab', 'ba', 'ca', 'ad'], n=1) == 2 + 2 + 3 + 4
+    with pytest.raises(ValueError):
+        sum_group_badges(['ab', 'ba', 'ca', 'ad'], n=3)
+
+
+def test_tuple_of_rucksacks_is_not_bulk():
+    data = tuple(read('test-input.txt'))
+    assert solve_part_one(data) == 157
+    assert solve_part_two(data) == 70
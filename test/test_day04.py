@@ -1,4 +1,10 @@
-from src.day04.camp_cleanup import read, solve_part_one, solve_part_two
+import numpy as np
+import pytest
+
+from src.day04.camp_cleanup import (
+    index_intervals, pairs_from_columns, read, solve_part_one, solve_part_two,
+    Interval, IntervalArray
+)
 
 
 def test_camp_cleanup_complete_overlap():
@@ -11,3 +17,67 @@ def test_camp_cleanup_overlap():
     data = read('test-input.txt')
     result = solve_part_two(data)
     assert result == 4
+
+
+def test_bulk_camp_cleanup():
+    data = read('test-input.txt', bulk=True)
+    assert len(data[0]) == 6
+    assert solve_part_one(data) == 2
+    assert solve_part_two(data) == 4
+
+
+def test_bulk_camp_cleanup_rejects_malformed_lines(tmp_path):
+    path = tmp_path / 'input.txt'
+    path.write_text('2-4,6-8\n2-3-4,5\n')
+    with pytest.raises(ValueError):
+        read(str(path), bulk=True)
+
+    path.write_text('2-4,8-6\n')
+    with pytest.raises(ValueError):
+        read(str(path), bulk=True)
+
+
+def test_interval_index_queries():
+    index = index_intervals(read('test-input.txt'))
+
+    def spans(intervals: list[Interval]) -> list[tuple[int, int]]:
+        return sorted((interval.start, interval.end) for interval in intervals)
+
+    assert spans(index.overlapping(Interval(1, 2))) == [(2, 3), (2, 4), (2, 6), (2, 8)]
+    assert spans(index.contained_in(Interval(3, 6))) == [(4, 5), (4, 6), (6, 6)]
+    assert spans(index.containing(Interval(4, 6))) == [(2, 6), (2, 8), (3, 7), (4, 6), (4, 8)]
+    assert index.count_overlapping(Interval(1, 2)) == 4
+
+
+def test_interval_index_overlapping_pairs():
+    intervals = [interval for pair in read('test-input.txt') for interval in pair]
+    expected = sum(
+        1
+        for i, one in enumerate(intervals)
+        for other in intervals[i + 1:]
+        if one.intersects(other)
+    )
+    assert index_intervals(read('test-input.txt')).count_overlapping_pairs() == expected == 49
+
+
+def test_interval_array():
+    starts, ends = np.array([2, 4, 6]), np.array([3, 4, 8])
+    intervals = IntervalArray(starts, ends)
+    assert len(intervals) == 3
+    assert (intervals[-1].start, intervals[-1].end) == (6, 8)
+    assert [interval.end for interval in intervals] == [3, 4, 8]
+
+    with pytest.raises(ValueError):
+        IntervalArray(ends, starts)
+
+
+def test_pairs_from_columns():
+    data = pairs_from_columns(*read('test-input.txt', bulk=True))
+    assert solve_part_one(data) == 2
+    assert solve_part_two(data) == 4
+
+
+def test_tuple_of_pairs_is_not_bulk():
+    data = tuple(read('test-input.txt'))
+    assert solve_part_one(data) == 2
+    assert solve_part_two(data) == 4
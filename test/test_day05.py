@@ -1,4 +1,11 @@
-from src.day05.supply_stacks import read, solve_part_one, solve_part_two
+import random
+
+import pytest
+
+from src.day05.supply_stacks import (
+    get_tops, iter_move_rows, iter_move_rows_backwards, read, simulate, solve_part_one,
+    solve_part_two, trace_tops, CrateStack, Move
+)
 
 
 def test_simulate_stacks():
@@ -11,3 +18,75 @@ def test_camp_cleanup_overlap():
     data = read('test-input.txt')
     result = solve_part_two(data)
     assert result == 'MCD'
+
+
+def test_crate_stack_moves_blocks():
+    stack, other = CrateStack('ABCD'), CrateStack('E')
+    other.put(stack.take(3))
+    assert list(stack) == ['A'] and list(other) == ['E', 'D', 'C', 'B']
+
+    stack.put(other.take(2, reverse=False))
+    assert list(stack) == ['A', 'C', 'B']
+    assert stack.top == 'B' and stack[1] == 'C' and len(other) == 2
+
+
+def test_simulate_keeps_the_drawing():
+    stacks, moves = read('test-input.txt')
+    simulate(stacks, moves)
+    assert stacks == read('test-input.txt')[0]
+
+
+def test_bulk_moves():
+    stacks, moves = read('test-input.txt', bulk=True)
+    assert stacks == read('test-input.txt')[0]
+    assert moves.shape == (4, 3) and moves.tolist()[1] == [3, 1, 3]
+    assert solve_part_one((stacks, moves)) == 'CMZ'
+    assert solve_part_two((stacks, moves)) == 'MCD'
+
+
+def test_bulk_moves_reject_malformed_lines(tmp_path):
+    path = tmp_path / 'input.txt'
+    path.write_text('[A]\n 1 \n\nmove 1 from 1 to 1\nmove 1 frm 1 to 1\n')
+    with pytest.raises(ValueError):
+        read(str(path), bulk=True)
+
+
+def test_traced_tops_match_simulation():
+    rng = random.Random(5)
+    stacks = {i: [rng.choice('ABCDEF') for _ in range(rng.randint(0, 10))] for i in range(1, 6)}
+    heights = {i: len(stack) for i, stack in stacks.items()}
+    moves = []
+    for _ in range(200):
+        from_stack = rng.choice([i for i, height in heights.items() if height])
+        to_stack = rng.choice(list(heights))
+        count = rng.randint(1, heights[from_stack])
+        if from_stack != to_stack:
+            heights[from_stack] -= count
+            heights[to_stack] += count
+        moves.append(Move(count, from_stack, to_stack))
+
+    for reverse in (True, False):
+        tops = trace_tops(stacks, moves, reverse)
+        expected = get_tops(simulate(stacks, moves, reverse))
+        assert ''.join(tops.get(i, '') for i in sorted(stacks)) == expected
+
+
+def test_moving_onto_the_same_stack_changes_nothing():
+    stacks = {1: ['A', 'B'], 2: ['C']}
+    assert trace_tops(stacks, [Move(2, 1, 1)]) == {1: 'B', 2: 'C'}
+    assert get_tops(simulate(stacks, [Move(2, 1, 1)])) == 'BC'
+
+
+def test_bulk_moves_in_blocks():
+    _, moves = read('test-input.txt', bulk=True)
+    rows = moves.tolist()
+    for block_size in (1, 2, 3, 100):
+        assert list(iter_move_rows(moves, block_size)) == rows
+        assert list(iter_move_rows_backwards(moves, block_size)) == rows[::-1]
+
+
+def test_trace_tops_of_any_moves():
+    stacks, moves = read('test-input.txt')
+    expected = trace_tops(stacks, moves)
+    assert trace_tops(stacks, tuple(moves)) == expected
+    assert trace_tops(stacks, iter(moves)) == expected
@@ -1,4 +1,9 @@
-from src.day06.tuning_trouble import read, solve_part_one, solve_part_two
+import pytest
+
+from src.day06.tuning_trouble import (
+    find_marker, find_markers, iter_stream_markers, read, solve_part_one, solve_part_two,
+    MarkerDetector
+)
 
 
 def test_find_start_of_packet():
@@ -13,3 +18,38 @@ def test_find_message():
         data = read(f'test-input-{i}.txt')
         result = solve_part_two(data)
         assert result == n
+
+
+def test_mapped_find_message():
+    with read('test-input-0.txt', mapped=True) as data:
+        result = solve_part_two(data)
+    assert result == 23
+
+
+def test_find_marker_on_bytes():
+    assert find_marker(b'abcabcd', 4) == 7
+    assert find_marker(b'aabcdefghijklmn', 14) == 15
+    with pytest.raises(ValueError):
+        find_marker(b'abcabc', 4)
+
+
+def test_marker_detector_across_chunks():
+    detector = MarkerDetector(4)
+    assert detector.feed(b'abca') == []
+    assert detector.feed(b'bcdd') == [7]
+    assert detector.feed(b'efg') == [11]
+    assert detector.position == 11
+
+
+def test_stream_markers():
+    with open('src/day06/input/test-input-0.txt', 'rb') as f:
+        markers = iter_stream_markers(f, 14, chunk_size=5)
+        assert next(markers) == 23
+
+
+def test_find_markers_in_one_pass():
+    data = read('test-input-0.txt')
+    assert find_markers(data, [14, 4, 4]) == {4: 5, 14: 23}
+    assert find_markers(data, []) == {}
+    with pytest.raises(ValueError):
+        find_markers(b'abcabc', [3, 4])
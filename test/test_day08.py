@@ -1,3 +1,5 @@
+import pytest
+
 from src.day08.treetop_tree_house import read, solve_part_one, solve_part_two
 
 
@@ -11,3 +13,22 @@ def test_find_biggest_scenic_score():
     data = read('test-input.txt')
     result = solve_part_two(data)
     assert result == 8
+
+
+def test_mapped_grid():
+    data = read('test-input.txt', mapped=True)
+    assert (data == read('test-input.txt')).all()
+
+
+def test_mapped_grid_rejects_ragged_rows(tmp_path):
+    path = tmp_path / 'ragged.txt'
+    path.write_bytes(b'123\n12\n1234\n')
+    with pytest.raises(ValueError):
+        read(str(path), mapped=True)
+
+
+def test_mapped_grid_rejects_empty_files(tmp_path):
+    path = tmp_path / 'empty.txt'
+    path.write_bytes(b'')
+    with pytest.raises(ValueError):
+        read(str(path), mapped=True)
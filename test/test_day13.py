@@ -11,3 +11,9 @@ def test_sort_lists():
     data = read(f'test-input.txt')
     result = solve_part_two(data)
     assert result == 140
+
+
+def test_lazy_compare_lists():
+    data = read('test-input.txt', lazy=True)
+    result = solve_part_one(data)
+    assert result == 13
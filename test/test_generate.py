@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from src.utils.days import load_day
+from src.tools.generate import GENERATORS, generate, parse_size, write_input
+
+
+@pytest.mark.parametrize('day', sorted(GENERATORS))
+def test_generated_inputs_are_solvable(day, tmp_path):
+    filename = os.path.join(tmp_path, 'generated.txt')
+    write_input(day, filename, size=512, seed=day)
+    module = load_day(day)
+    data = module.read(filename)
+    module.solve_part_one(data)
+    module.solve_part_two(data)
+
+
+def test_generators_are_seeded():
+    assert ''.join(generate(13, 4096, seed=1)) == ''.join(generate(13, 4096, seed=1))
+    assert ''.join(generate(13, 4096, seed=1)) != ''.join(generate(13, 4096, seed=2))
+
+
+def test_parse_size():
+    assert parse_size('512') == 512
+    assert parse_size('2K') == 2048
+    assert parse_size('1.5MB') == 3 * 512 * 1024
+    assert parse_size('1g') == 1024 ** 3
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_generated_terminal_output_fits_the_disk(seed, tmp_path):
+    filename = os.path.join(tmp_path, 'generated.txt')
+    write_input(7, filename, size=4096, seed=seed)
+    module = load_day(7)
+    data = module.read(filename)
+    used = data.used_space
+    assert 40_000_000 <= used <= 70_000_000
+    assert used - 40_000_000 <= module.solve_part_two(data) <= used
+
+
+def test_generated_directories_are_listed_once():
+    path, listed = [], []
+    for line in ''.join(generate(7, 4096, seed=1)).splitlines():
+        if line == '$ cd /':
+            path = []
+        elif line == '$ cd ..':
+            path.pop()
+        elif line.startswith('$ cd '):
+            path.append(line.removeprefix('$ cd '))
+        elif line == '$ ls':
+            listed.append(tuple(path))
+    assert len(listed) == len(set(listed)) > 1
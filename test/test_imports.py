@@ -0,0 +1,41 @@
+import sys
+import subprocess
+
+from src.utils.days import find_days
+
+# Microseconds, generous enough for slow machines but far below what numpy costs
+IMPORT_BUDGET = 150_000
+
+
+def import_times(code: str) -> dict[str, int]:
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.removeprefix('import time:').split('|')
+        # Nested imports are indented and already counted by their parent
+        if not name.startswith('  '):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_days_do_not_import_numpy():
+    times = import_times('import ' + ', '.join(find_days().values()))
+    assert not any(name.startswith('numpy') for name in times)
+
+
+def test_single_day_import_budget():
+    code = 'from src.tools.runner import Task, run_task\nrun_task(Task(1, "test-input.txt"))'
+    totals = []
+    # The fastest of a few runs, a single one is at the mercy of whatever else the machine does
+    for _ in range(3):
+        times = import_times(code)
+        assert not any(name.startswith('numpy') for name in times)
+        totals.append(sum(t for name, t in times.items() if name.startswith('src')))
+    assert min(totals) < IMPORT_BUDGET
@@ -0,0 +1,15 @@
+from src.utils.io import find_shards
+
+
+def test_shards_of_records_longer_than_a_chunk(tmp_path):
+    path = tmp_path / 'records.txt'
+    records = [bytes([ord('a') + i % 26]) * (10 + 7 * i) for i in range(8)]
+    path.write_bytes(b'\n'.join(records) + b'\n')
+    data = path.read_bytes()
+
+    for separator in (b'\n', b'a\n'):
+        for shards in (1, 2, 3, 20):
+            ranges = find_shards(str(path), shards, separator=separator, chunk_size=4)
+            assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+            assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+            assert all(data[:start].endswith(separator) for start, _ in ranges[1:])
@@ -0,0 +1,30 @@
+import pstats
+
+from src.utils import profiling
+from src.day12.hill_climbing_algorithm import read, solve_part_one
+
+
+def test_phases_are_collected(tmp_path):
+    profiling.reset()
+    profiling.enable(track_memory=True)
+    try:
+        solve_part_one(read('test-input.txt'))
+    finally:
+        profiling.disable()
+
+    stats = profiling.phase_stats()
+    assert stats['day12.climb'].calls == 1
+    assert stats['day12.climb.queue'].calls > 1
+    assert stats['day12.climb'].seconds >= stats['day12.climb.queue'].seconds
+    assert 'day12.climb;day12.climb.queue ' in profiling.collapsed_stacks()
+
+    filename = str(tmp_path / 'profile')
+    profiling.dump(filename)
+    assert pstats.Stats(filename).total_calls > 0
+    profiling.reset()
+
+
+def test_disabled_phases_collect_nothing():
+    profiling.reset()
+    solve_part_one(read('test-input.txt'))
+    assert profiling.phase_stats() == {}
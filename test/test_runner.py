@@ -0,0 +1,22 @@
+from src.tools.runner import Task, run_tasks
+
+
+def test_run_tasks():
+    tasks = [Task(1, 'test-input.txt'), Task(2, 'test-input.txt', parts=(2,))]
+    results = list(run_tasks(tasks))
+    assert [[p.answer for p in r.parts] for r in results] == [[24000, 45000], [12]]
+
+
+def test_run_tasks_in_pool():
+    tasks = [Task(3, 'test-input.txt'), Task(4, 'test-input.txt')]
+    results = list(run_tasks(tasks, jobs=2))
+    assert [[p.answer for p in r.parts] for r in results] == [[157, 70], [2, 4]]
+
+
+def test_run_tasks_memoized(tmp_path):
+    task = Task(11, 'test-input.txt', memo_dir=str(tmp_path))
+    first, = run_tasks([task])
+    second, = run_tasks([task])
+    assert [p.memoized for p in first.parts] == [False, False]
+    assert [p.memoized for p in second.parts] == [True, True]
+    assert [p.answer for p in second.parts] == [10605, 2713310158]